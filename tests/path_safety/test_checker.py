@@ -171,3 +171,203 @@ class TestPathChecker:
         # Note: Since /tmp is the same, we should have at least 1 entry
         assert len(confirmed) >= 1
         assert Path("/tmp") in confirmed
+
+    def test_prefix_match_respects_component_boundaries(self, tmp_path):
+        """A sibling sharing a name prefix must not match a whitelisted directory."""
+        whitelist = PathWhitelist(cli_paths={Path("/allowed")}, workdir=Path("/workspace"))
+        assert whitelist.is_whitelisted(Path("/allowed"))
+        assert not whitelist.is_whitelisted(Path("/allowed-other/file.txt"))
+        assert not whitelist.is_whitelisted(Path("/workspace2/file.txt"))
+
+        # An existing directory is confirmed as-is (not its parent)
+        (tmp_path / "data").mkdir()
+        checker = PathChecker(PathWhitelist(_default_allowed=set()))
+        checker.confirm_directory(tmp_path / "data")
+        assert checker.check(tmp_path / "data" / "file.txt", Operation.WRITE).allowed
+        assert not checker.check(tmp_path / "database" / "file.txt", Operation.WRITE).allowed
+
+    def test_many_entries_and_root_entry(self):
+        """Lookups stay component-exact with many entries and cover everything under /."""
+        whitelist = PathWhitelist(config_paths={Path(f"/data/d{i}") for i in range(200)})
+        assert whitelist.is_whitelisted(Path("/data/d150/file.txt"))
+        assert whitelist.is_whitelisted(Path("/data/d7"))
+        assert not whitelist.is_whitelisted(Path("/data/d1500/file.txt"))
+        assert not whitelist.is_whitelisted(Path("/data"))
+
+        assert PathWhitelist(cli_paths={Path("/")}).is_whitelisted(Path("/etc/hosts"))
+
+    def test_check_results_are_memoized_until_confirmation(self, tmp_path):
+        """Repeated checks reuse the result; confirming a directory invalidates it."""
+        checker = PathChecker(PathWhitelist(_default_allowed=set()))
+        target = str(tmp_path / "file.txt")
+
+        first = checker.check(target, Operation.WRITE)
+        assert first.requires_confirmation
+        assert checker.check(target, Operation.WRITE) is first
+
+        checker.confirm_directory(tmp_path)
+        assert checker.check(target, Operation.WRITE).allowed
+
+    def test_memo_does_not_outlive_a_symlink_change(self, tmp_path):
+        """A path re-pointed outside the whitelist is checked again, not answered from the memo."""
+        work = tmp_path / "work"
+        (work / "link").mkdir(parents=True)
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        checker = PathChecker(PathWhitelist(workdir=work, _default_allowed=set()))
+        target = str(work / "link" / "secret.txt")
+        assert checker.check(target, Operation.WRITE).allowed
+
+        (work / "link").rmdir()
+        (work / "link").symlink_to(outside)
+
+        result = checker.check(target, Operation.WRITE)
+        assert result.requires_confirmation
+        assert str(outside) in result.reason
+
+    def test_check_cache_is_bounded(self, monkeypatch):
+        """The memo evicts the least recently used entry beyond its size."""
+        monkeypatch.setattr(PathChecker, "CHECK_CACHE_SIZE", 2)
+        checker = PathChecker(PathWhitelist())
+        for name in ("a", "b", "c"):
+            checker.check(f"/tmp/{name}", Operation.WRITE)
+        assert [key[0] for key in checker._cache] == ["/tmp/b", "/tmp/c"]
+
+    def test_whitelist_entries_are_resolved_once(self, tmp_path):
+        """Symlinked entries match the resolved paths the checker passes in."""
+        real = tmp_path / "real"
+        real.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(real)
+
+        whitelist = PathWhitelist(workdir=link, cli_paths={link}, _default_allowed=set())
+        assert whitelist.is_whitelisted(real / "file.txt")
+        assert PathChecker(whitelist).check(str(link / "file.txt"), Operation.WRITE).allowed
+
+    def test_confirmed_dir_swapped_for_symlink_grants_nothing_new(self, tmp_path):
+        """Confirmed dirs aren't re-resolved, so a symlink put in their place isn't followed."""
+        confirmed = tmp_path / "confirmed"
+        confirmed.mkdir()
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        checker = PathChecker(PathWhitelist(_default_allowed=set()))
+        checker.confirm_directory(confirmed)
+        saved = checker.get_confirmed_dirs()
+
+        confirmed.rmdir()
+        confirmed.symlink_to(outside)
+
+        whitelist = PathWhitelist(confirmed_dirs=set(saved), _default_allowed=set())
+        assert not whitelist.is_whitelisted(outside / "file.txt")
+        result = PathChecker(whitelist).check(confirmed / "file.txt", Operation.WRITE)
+        assert result.requires_confirmation
+
+    def test_absolute_paths_are_normalized_and_symlinks_followed(self, tmp_path):
+        """The absolute-path fast path still collapses '..' and follows symlinks."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (tmp_path / "allowed").mkdir()
+        (tmp_path / "allowed" / "escape").symlink_to(outside)
+
+        checker = PathChecker(
+            PathWhitelist(cli_paths={tmp_path / "allowed"}, _default_allowed=set())
+        )
+        assert checker.check(f"{tmp_path}/outside/../allowed/f.txt", Operation.WRITE).allowed
+        result = checker.check(f"{tmp_path}/allowed/escape/f.txt", Operation.WRITE)
+        assert result.requires_confirmation
+        assert str(outside) in result.reason
+
+    def test_read_returns_shared_result(self):
+        """READ checks hand out one prebuilt result without touching the path."""
+        checker = PathChecker(PathWhitelist())
+        first = checker.check("/etc/passwd", Operation.READ)
+        assert first is checker.check("relative/file.txt", Operation.READ)
+        assert first.allowed and first.operation is Operation.READ
+
+    def test_whitelist_accepts_path_strings(self):
+        """is_whitelisted matches string forms exactly like Path objects."""
+        whitelist = PathWhitelist(config_paths={Path("/project")})
+        assert whitelist.is_whitelisted("/project")
+        assert whitelist.is_whitelisted("/project/src/main.py")
+        assert not whitelist.is_whitelisted("/projects/main.py")
+
+    def test_relative_paths_are_never_whitelisted(self):
+        """Relative inputs simply don't match; nothing is resolved or raised."""
+        whitelist = PathWhitelist(workdir=Path("/workspace"))
+        assert not whitelist.is_whitelisted(Path("workspace/file.txt"))
+        assert not whitelist.is_whitelisted("tmp/file.txt")
+        assert not whitelist.is_whitelisted("")
+
+    def test_compiled_whitelist_edge_cases(self):
+        """The compiled pattern treats regex metacharacters and newlines literally."""
+        whitelist = PathWhitelist(
+            cli_paths={Path("/data/a+b"), Path("/data/a+b/nested"), Path("/srv/x.y")},
+            _default_allowed=set(),
+        )
+        assert whitelist.is_whitelisted("/data/a+b/file.txt")
+        assert not whitelist.is_whitelisted("/data/aab/file.txt")
+        assert not whitelist.is_whitelisted("/srv/xzy/file.txt")
+        assert not whitelist.is_whitelisted("/srv/x.y\n")
+        assert not PathWhitelist(_default_allowed=set()).is_whitelisted("/tmp/file.txt")
+
+    def test_relative_paths_share_the_memo(self, tmp_path, monkeypatch):
+        """Relative paths are anchored to the current directory before memoizing."""
+        monkeypatch.chdir(tmp_path)
+        checker = PathChecker(PathWhitelist(cli_paths={tmp_path}, _default_allowed=set()))
+
+        first = checker.check("sub/file.txt", Operation.WRITE)
+        assert first.allowed
+        assert checker.check(str(tmp_path / "sub" / "file.txt"), Operation.WRITE) is first
+
+        # The same relative path from another directory is a different path
+        monkeypatch.chdir("/")
+        assert checker.check("sub/file.txt", Operation.WRITE).requires_confirmation
+
+    def test_check_many_matches_check(self):
+        """check_many returns the same results as checking one path at a time."""
+        checker = PathChecker(PathWhitelist(config_paths={Path("/project")}))
+        paths = ["/project/a.py", "/etc/passwd", "/tmp/x", Path("/project/b.py")]
+
+        results = checker.check_many(paths, Operation.WRITE)
+        assert [r.allowed for r in results] == [True, False, True, True]
+        assert results == [checker.check(p, Operation.WRITE) for p in paths]
+        assert all(r.allowed for r in checker.check_many(paths, Operation.READ))
+
+    def test_confirming_leaves_whitelist_untouched(self, tmp_path):
+        """Confirmed directories are matched by the checker, not added to the whitelist."""
+        whitelist = PathWhitelist(_default_allowed=set())
+        checker = PathChecker(whitelist)
+        checker.confirm_directory(tmp_path)
+
+        assert checker.check(tmp_path / "file.txt", Operation.WRITE).allowed
+        assert not whitelist.is_whitelisted(tmp_path / "file.txt")
+        assert (
+            PathChecker(whitelist).check(tmp_path / "a.txt", Operation.WRITE).requires_confirmation
+        )
+
+    def test_confirm_directory_classifies_real_path(self, tmp_path):
+        """Files (even behind symlinks) and missing paths confirm the real parent."""
+        real_dir = tmp_path / "real"
+        real_dir.mkdir()
+        (real_dir / "file.txt").write_text("x")
+        (tmp_path / "link.txt").symlink_to(real_dir / "file.txt")
+
+        checker = PathChecker(PathWhitelist(_default_allowed=set()))
+        checker.confirm_directory(tmp_path / "link.txt")
+        checker.confirm_directory(tmp_path / "missing" / "new.txt")
+        checker.confirm_directory(real_dir)
+
+        assert set(checker.get_confirmed_dirs()) == {real_dir, tmp_path / "missing"}
+
+    def test_confirm_keeps_memoized_allowed_results(self, tmp_path):
+        """Confirming only evicts results that weren't allowed."""
+        (tmp_path / "new").mkdir()
+        checker = PathChecker(PathWhitelist(cli_paths={tmp_path / "ok"}, _default_allowed=set()))
+        allowed = checker.check(tmp_path / "ok" / "a.txt", Operation.WRITE)
+        pending = checker.check(tmp_path / "new" / "b.txt", Operation.WRITE)
+        assert allowed.allowed and pending.requires_confirmation
+
+        checker.confirm_directory(tmp_path / "new")
+
+        assert checker.check(tmp_path / "ok" / "a.txt", Operation.WRITE) is allowed
+        assert checker.check(tmp_path / "new" / "b.txt", Operation.WRITE).allowed
@@ -52,3 +52,22 @@ def test_initialize_path_guard_for_session_loads_confirmed_dirs(tmp_path, monkey
 
     confirmed = {str(p) for p in path_guard_executor.get_confirmed_dirs()}
     assert "/tmp/confirmed" in confirmed
+
+
+def test_reinitializing_closes_previous_audit_log(tmp_path):
+    config = SimpleNamespace(
+        path_safety=SimpleNamespace(allowed_write_paths=[], audit_log_file=tmp_path / "audit.log")
+    )
+    path_guard_executor._middleware = None
+    path_guard_executor._path_checker = None
+
+    initialize_path_guard_for_session(config=config, session_id=None, workdir=None)
+    strategy = path_guard_executor.get_path_guard_middleware()._strategy
+    strategy._audit_denial("/etc/x", "write", "user_denied")
+    handle = strategy._audit_fh
+    assert handle is not None
+
+    initialize_path_guard_for_session(config=config, session_id=None, workdir=None)
+    assert handle.closed
+
+    path_guard_executor.close_path_guard_middleware()
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from wolo import _json
 from wolo.path_guard import set_path_guard
 from wolo.path_guard.checker import PathChecker, PathWhitelist
 from wolo.path_guard.cli_strategy import CLIConfirmationStrategy
@@ -55,3 +56,87 @@ async def test_denied_operation_writes_audit_log(tmp_path):
     assert entry["path"] == "/workspace/blocked.py"
     assert entry["operation"] == "write"
     assert entry["reason"] == "non_interactive_auto_deny"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("use_orjson", [True, False])
+async def test_audit_log_reuses_one_handle(tmp_path, monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(_json, "orjson", None)
+    audit_file = tmp_path / "logs" / "path_audit.log"
+    strategy = CLIConfirmationStrategy(audit_denied=True, audit_log_file=audit_file)
+
+    with patch("sys.stdin.isatty", return_value=False):
+        assert await strategy.confirm("/workspace/a.py", "write") is False
+        handle = strategy._audit_fh
+        assert await strategy.confirm("/workspace/b.py", "edit") is False
+
+    assert strategy._audit_fh is handle
+    # Entries are visible without closing the handle
+    lines = audit_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["path"] for line in lines] == ["/workspace/a.py", "/workspace/b.py"]
+    assert json.loads(lines[1])["operation"] == "edit"
+
+    strategy.close()
+    assert handle.closed
+
+
+@pytest.mark.asyncio
+async def test_prompt_header_output(capsys):
+    strategy = CLIConfirmationStrategy(audit_denied=False)
+
+    with patch("sys.stdin.isatty", return_value=False):
+        await strategy.confirm("/workspace/../workspace/a.py", "write")
+
+    assert capsys.readouterr().out == (
+        "\nPath Confirmation Required\n"
+        "Operation: write\n"
+        "Path: /workspace/../workspace/a.py\n"
+        "Resolved Path: /workspace/a.py\n"
+        "This path is not in the default allowlist (/tmp) or configured whitelist.\n"
+        "Non-interactive mode, operation denied.\n"
+    )
+
+
+@pytest.mark.asyncio
+async def test_tty_check_runs_once_per_strategy():
+    strategy = CLIConfirmationStrategy(audit_denied=False)
+
+    with patch("sys.stdin.isatty", return_value=False) as isatty:
+        await strategy.confirm("/workspace/a.py", "write")
+        await strategy.confirm("/workspace/b.py", "write")
+
+    assert isatty.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_confirm_uses_current_global_guard(tmp_path):
+    strategy = CLIConfirmationStrategy(audit_denied=False)
+    # Installed after the strategy was created
+    checker = PathChecker(PathWhitelist())
+    set_path_guard(checker)
+
+    with (
+        patch("sys.stdin.isatty", return_value=True),
+        patch.object(strategy, "_read_confirmation_input", return_value="y"),
+    ):
+        assert await strategy.confirm(str(tmp_path / "new.txt"), "write") is True
+
+    assert checker.get_confirmed_dirs() == [tmp_path]
+
+
+@pytest.mark.asyncio
+async def test_allow_parent_confirms_containing_directory(tmp_path, capsys):
+    strategy = CLIConfirmationStrategy(audit_denied=False)
+    checker = PathChecker(PathWhitelist())
+    set_path_guard(checker)
+    target = tmp_path / "sub" / "new.txt"
+
+    with (
+        patch("sys.stdin.isatty", return_value=True),
+        patch.object(strategy, "_read_confirmation_input", return_value="a"),
+    ):
+        assert await strategy.confirm(str(target), "write") is True
+
+    assert checker.get_confirmed_dirs() == [tmp_path]
+    assert f"Added {tmp_path / 'sub'} and subdirectories" in capsys.readouterr().out
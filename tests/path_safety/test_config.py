@@ -1,8 +1,11 @@
 # tests/path_safety/test_config.py
 """Tests for PathGuardConfig module."""
 
+from dataclasses import FrozenInstanceError
 from pathlib import Path
 
+import pytest
+
 from wolo.path_guard.checker import PathWhitelist
 from wolo.path_guard.config import PathGuardConfig
 
@@ -123,3 +126,27 @@ class TestPathGuardConfig:
         assert data["config_paths"] == ["/project"]
         assert data["cli_paths"] == ["/allowed"]
         assert data["workdir"] == "/workspace"
+
+    def test_paths_resolved_once_at_construction(self, tmp_path, monkeypatch):
+        """create_whitelist reuses the paths resolved when the config was built."""
+        import wolo.path_guard.config as config_mod
+
+        config = PathGuardConfig(config_paths=[tmp_path], workdir=tmp_path)
+
+        def fail(path):
+            raise AssertionError(f"unexpected resolve of {path}")
+
+        monkeypatch.setattr(config_mod, "realpath", fail)
+        whitelist = config.create_whitelist(confirmed_dirs=set())
+        assert whitelist.config_paths == {tmp_path.resolve()}
+        assert whitelist.workdir == tmp_path.resolve()
+
+    def test_config_is_frozen(self, tmp_path):
+        """Fields can't be reassigned after the paths were resolved."""
+        config = PathGuardConfig(workdir=tmp_path)
+
+        with pytest.raises(FrozenInstanceError):
+            config.workdir = Path("/elsewhere")
+        with pytest.raises(FrozenInstanceError):
+            config.cli_paths = [Path("/elsewhere")]
+        assert config.create_whitelist(set()).workdir == tmp_path.resolve()
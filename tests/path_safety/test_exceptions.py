@@ -49,6 +49,14 @@ class TestCheckResult:
         assert result.requires_confirmation is False
         assert result.operation == Operation.WRITE
 
+    def test_allowed_for_shares_one_result_per_operation(self):
+        """allowed_for should hand out one prebuilt result per operation."""
+        for operation in Operation:
+            result = CheckResult.allowed_for(operation)
+            assert result is CheckResult.allowed_for(operation)
+            assert result.allowed is True
+            assert result.operation is operation
+
     def test_requires_confirmation_factory(self):
         """requires_confirmation should create a confirmation result."""
         path = "/workspace/test.py"
@@ -2,6 +2,7 @@
 """Tests for PathGuardMiddleware module."""
 
 from pathlib import Path
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -162,3 +163,41 @@ class TestPathGuardMiddleware:
             mock_tool, file_path="/workspace/file2.txt", operation=Operation.WRITE
         )
         assert result2["output"] == "success"
+
+    async def test_trivial_strategy_is_not_awaited(self):
+        """Constant strategies are answered from TRIVIAL_RESULT without calling confirm()."""
+        checker = PathChecker(PathWhitelist(_default_allowed=set()))
+        strategy = AutoDenyConfirmationStrategy()
+        # Instance attribute: the class still declares the constant answer
+        strategy.confirm = AsyncMock(side_effect=AssertionError("confirm() called"))
+        mock_tool = MockToolFunc()
+        middleware = PathGuardMiddleware(checker, strategy)
+
+        result = await middleware.execute_with_path_check(
+            mock_tool, file_path="/workspace/file.txt", operation=Operation.WRITE
+        )
+
+        assert result["metadata"]["error"] == "path_denied_by_user"
+        assert mock_tool.called_with is None
+
+    async def test_subclass_overriding_confirm_is_awaited(self):
+        """A subclass that overrides confirm() doesn't inherit the constant answer."""
+        calls = []
+
+        class LoggingAllow(AutoAllowConfirmationStrategy):
+            async def confirm(self, path, operation):
+                calls.append(path)
+                return False
+
+        assert LoggingAllow.TRIVIAL_RESULT is None
+        checker = PathChecker(PathWhitelist(_default_allowed=set()))
+        mock_tool = MockToolFunc()
+        middleware = PathGuardMiddleware(checker, LoggingAllow())
+
+        result = await middleware.execute_with_path_check(
+            mock_tool, file_path="/workspace/file.txt", operation=Operation.WRITE
+        )
+
+        assert calls == ["/workspace/file.txt"]
+        assert result["metadata"]["error"] == "path_denied_by_user"
+        assert mock_tool.called_with is None
@@ -149,3 +149,19 @@ class TestPathGuardPersistence:
         # Verify timestamp is recent
         last_updated = datetime.fromisoformat(data["last_updated"])
         assert before_save <= last_updated <= after_save
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip_non_ascii_paths(self, temp_session_dir, monkeypatch, use_orjson):
+        """Saved files stay ASCII JSON and load back with or without orjson."""
+        from wolo import _json
+
+        if not use_orjson:
+            monkeypatch.setattr(_json, "orjson", None)
+        persistence = PathGuardPersistence(temp_session_dir)
+        dirs = [Path("/tmp/项目"), Path("/workspace/café")]
+
+        persistence.save_confirmed_dirs("s1", dirs)
+
+        raw = (temp_session_dir / "s1" / "path_confirmations.json").read_bytes()
+        assert raw.isascii()
+        assert persistence.load_confirmed_dirs("s1") == dirs
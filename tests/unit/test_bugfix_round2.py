@@ -388,6 +388,7 @@ class TestP0McpToolNameFormat(unittest.TestCase):
         try:
             mock_tool = MagicMock()
             mock_tool.name = "search"
+            mock_tool.full_name = "mcp_web-search__search"
             mock_tool.description = "Search the web"
             mock_tool.input_schema = {"properties": {}, "required": []}
             mock_manager.get_all_tools.return_value = [("web-search", mock_tool)]
@@ -10,6 +10,7 @@ from wolo.claude.mcp_config import (
 )
 from wolo.claude.skill_loader import (
     find_matching_skills,
+    load_all_skills,
     load_claude_skills,
     load_skill,
     parse_frontmatter,
@@ -185,6 +186,36 @@ description: Skill {name}
         names = {s.name for s in skills}
         assert names == {"skill-a", "skill-b"}
 
+    def test_load_all_skills_wolo_takes_precedence(self, tmp_path):
+        """Test loading Wolo and Claude skills together."""
+        wolo_dir = tmp_path / "wolo"
+        claude_dir = tmp_path / "claude"
+
+        for base, name, desc in [
+            (wolo_dir, "shared", "from wolo"),
+            (wolo_dir, "wolo-only", "wolo skill"),
+            (claude_dir, "shared", "from claude"),
+            (claude_dir, "claude-only", "claude skill"),
+        ]:
+            skill_dir = base / name
+            skill_dir.mkdir(parents=True)
+            (skill_dir / "SKILL.md").write_text(f"""---
+name: {name}
+description: {desc}
+---
+""")
+        (claude_dir / ".hidden").mkdir()
+
+        skills = load_all_skills(wolo_dir, claude_dir, claude_enabled=True)
+        by_name = {s.name: s for s in skills}
+        assert set(by_name) == {"shared", "wolo-only", "claude-only"}
+        assert by_name["shared"].description == "from wolo"
+
+        skills = load_all_skills(wolo_dir, claude_dir, claude_enabled=False)
+        assert {s.name for s in skills} == {"shared", "wolo-only"}
+
+        assert load_all_skills(tmp_path / "missing", claude_dir) == []
+
     def test_find_matching_skills(self, tmp_path):
         """Test finding matching skills."""
         skills_dir = tmp_path / "skills"
@@ -315,3 +346,15 @@ class TestMCPServerConfig:
 
         # Wolo-only server added
         assert merged["custom"].command == "python"
+
+    def test_merge_mcp_configs_one_side_empty(self):
+        """Test merging when only one source has servers."""
+        servers = {"custom": MCPServerConfig(name="custom", command="python")}
+
+        merged = merge_mcp_configs({}, servers)
+        assert merged == servers
+        assert merged is not servers
+
+        merged = merge_mcp_configs(servers, {})
+        assert merged == servers
+        assert merged is not servers
@@ -0,0 +1,40 @@
+"""Tests for the shared JSON helpers, under each backend."""
+
+import json
+from pathlib import PurePosixPath
+
+import pytest
+
+from wolo import _json
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    """Run a test once with orjson (when installed) and once with stdlib json."""
+    if request.param == "stdlib":
+        monkeypatch.setattr(_json, "orjson", None)
+    elif _json.orjson is None:
+        pytest.skip("orjson not installed")
+    return request.param
+
+
+def test_dumps_and_loads_round_trip(backend):
+    data = {"name": "中文", "items": [1, 2.5, None, True], 3: "int key"}
+
+    raw = _json.dumps_bytes(data)
+    assert isinstance(raw, bytes)
+    assert b"\n" not in raw
+    assert "中文".encode() in raw
+    assert _json.loads(raw) == json.loads(json.dumps(data))
+    assert _json.loads(raw.decode("utf-8")) == _json.loads(raw)
+
+
+def test_indent_and_default(backend):
+    raw = _json.dumps_bytes({"a": {"path": PurePosixPath("/x/y")}}, indent=True, default=str)
+
+    assert raw.decode("utf-8") == '{\n  "a": {\n    "path": "/x/y"\n  }\n}'
+
+
+def test_loads_rejects_invalid_json(backend):
+    with pytest.raises(json.JSONDecodeError):
+        _json.loads(b"{broken")
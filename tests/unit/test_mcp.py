@@ -1,10 +1,13 @@
 """Tests for MCP module using official MCP SDK."""
 
+from unittest.mock import patch
+
 import pytest
 
 pytest.importorskip("mcp")
 
 from wolo.claude.mcp_config import MCPServerConfig
+from wolo.mcp import node_check
 from wolo.mcp.client import MCPClient, MCPConnectionError, MCPError, MCPTool
 from wolo.mcp.node_check import (
     check_node_available,
@@ -91,6 +94,22 @@ class TestNodeCheck:
         result = check_npx_available()
         assert isinstance(result, bool)
 
+    def test_check_npx_available_is_cached(self):
+        """Repeated npx checks within the TTL don't probe PATH again."""
+        node_check.clear_npx_cache()
+        try:
+            with patch.object(node_check.shutil, "which", return_value="/usr/bin/npx") as which:
+                assert check_npx_available() is True
+                assert check_npx_available() is True
+                assert which.call_count == 1
+
+                node_check.clear_npx_cache()
+                which.return_value = None
+                assert check_npx_available() is False
+                assert which.call_count == 2
+        finally:
+            node_check.clear_npx_cache()
+
     def test_get_installation_instructions(self):
         """Test getting installation instructions."""
         instructions = get_installation_instructions()
@@ -141,6 +160,19 @@ class TestMCPServerManager:
         assert "server-a" in status
         assert "server-b" in status
 
+    def test_tools_generation_bumps_on_add(self):
+        """Adding servers changes the tools generation counter."""
+        manager = MCPServerManager()
+        before = manager.tools_generation
+        manager.add_server(MCPServerConfig(name="test", command="echo"))
+        assert manager.tools_generation != before
+
+    def test_assign_full_names_uses_double_underscore(self):
+        """Connected tools get their prefixed name computed once."""
+        tools = [MCPTool(name="search", description="Search")]
+        MCPServerManager._assign_full_names("web-search", tools)
+        assert tools[0].full_name == "mcp_web-search__search"
+
     def test_is_mcp_tool(self):
         """Test MCP tool name detection."""
         manager = MCPServerManager()
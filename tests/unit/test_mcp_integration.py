@@ -0,0 +1,192 @@
+"""Tests for MCP integration callbacks and cache persistence."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import wolo.mcp_integration as mcp_mod
+
+
+def _make_tool(name: str, server: str = "srv") -> MagicMock:
+    tool = MagicMock()
+    tool.name = name
+    tool.full_name = f"mcp_{server}__{name}"
+    tool.description = f"{name} tool"
+    tool.input_schema = {"properties": {}, "required": []}
+    return tool
+
+
+@pytest.fixture
+def isolated_state():
+    """Reset module-level MCP integration state around each test."""
+    saved = (
+        mcp_mod._mcp_manager,
+        mcp_mod._mcp_cache,
+        mcp_mod._cache_dirty,
+        mcp_mod._cache_flush_task,
+        mcp_mod._registered_mcp_tools,
+        mcp_mod._last_registered_generation,
+    )
+    mcp_mod._mcp_manager = None
+    mcp_mod._mcp_cache = None
+    mcp_mod._cache_dirty = False
+    mcp_mod._cache_flush_task = None
+    mcp_mod._registered_mcp_tools = set()
+    mcp_mod._last_registered_generation = None
+    yield
+    (
+        mcp_mod._mcp_manager,
+        mcp_mod._mcp_cache,
+        mcp_mod._cache_dirty,
+        mcp_mod._cache_flush_task,
+        mcp_mod._registered_mcp_tools,
+        mcp_mod._last_registered_generation,
+    ) = saved
+
+
+class TestCacheFlushDebounce:
+    """Cache writes from server connections are coalesced."""
+
+    @pytest.mark.asyncio
+    async def test_connect_burst_saves_once(self, isolated_state):
+        with (
+            patch.object(mcp_mod, "save_cache") as mock_save,
+            patch.object(mcp_mod, "CACHE_FLUSH_DELAY", 0.01),
+        ):
+            for i in range(5):
+                await mcp_mod._on_server_connected(f"server{i}", [_make_tool("t")])
+
+            mock_save.assert_not_called()
+            await mcp_mod._cache_flush_task
+
+            mock_save.assert_called_once()
+            assert len(mcp_mod._mcp_cache.servers) == 5
+            assert mcp_mod._cache_dirty is False
+
+    @pytest.mark.asyncio
+    async def test_init_complete_cancels_pending_flush(self, isolated_state):
+        with (
+            patch.object(mcp_mod, "save_cache") as mock_save,
+            patch.object(mcp_mod, "CACHE_FLUSH_DELAY", 10),
+        ):
+            await mcp_mod._on_server_connected("server", [_make_tool("t")])
+            pending = mcp_mod._cache_flush_task
+
+            mcp_mod._mcp_manager = MagicMock()
+            mcp_mod._mcp_manager._servers = {}
+            await mcp_mod._on_init_complete()
+            await asyncio.sleep(0)
+
+            assert pending.cancelled()
+            assert mcp_mod._cache_flush_task is None
+            mock_save.assert_called_once()
+
+
+class TestSaveCacheAsync:
+    """Cache writes run off the event loop thread."""
+
+    @pytest.mark.asyncio
+    async def test_save_runs_in_worker_thread(self, isolated_state):
+        import threading
+
+        from wolo.mcp.cache import MCPCache
+
+        loop_thread = threading.get_ident()
+        save_threads = []
+
+        def fake_save(cache):
+            save_threads.append(threading.get_ident())
+            cache.updated_at = 42.0
+
+        live = MCPCache()
+        with patch.object(mcp_mod, "save_cache", side_effect=fake_save):
+            await mcp_mod._save_cache_async(live)
+
+        assert save_threads and save_threads[0] != loop_thread
+        assert live.updated_at == 42.0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_flush_does_not_overlap_next_save(self, isolated_state):
+        import threading
+
+        from wolo.mcp.cache import MCPCache
+
+        started = threading.Event()
+        release = threading.Event()
+        active = 0
+        overlaps = []
+
+        def fake_save(cache):
+            nonlocal active
+            active += 1
+            overlaps.append(active > 1)
+            started.set()
+            release.wait(5)
+            active -= 1
+
+        with patch.object(mcp_mod, "save_cache", side_effect=fake_save):
+            flush = asyncio.create_task(mcp_mod._save_cache_async(MCPCache()))
+            await asyncio.to_thread(started.wait, 5)
+            flush.cancel()
+
+            second = asyncio.create_task(mcp_mod._save_cache_async(MCPCache()))
+            await asyncio.sleep(0.05)
+            release.set()
+            await second
+
+        assert overlaps == [False, False]
+
+
+class TestRegisterMcpTools:
+    """Tool registration skips work when the manager's tools are unchanged."""
+
+    def test_unchanged_generation_skips_scan(self, isolated_state):
+        manager = MagicMock()
+        manager.tools_generation = 1
+        manager.get_all_tools.return_value = [("srv", _make_tool("search"))]
+        mcp_mod._mcp_manager = manager
+
+        with patch.object(mcp_mod, "get_registry") as mock_registry:
+            mcp_mod.refresh_mcp_tools()
+            mcp_mod.refresh_mcp_tools()
+
+            assert manager.get_all_tools.call_count == 1
+            mock_registry.return_value.register.assert_called_once()
+
+            manager.tools_generation = 2
+            manager.get_all_tools.return_value.append(("srv", _make_tool("fetch")))
+            mcp_mod.refresh_mcp_tools()
+
+            assert manager.get_all_tools.call_count == 2
+            assert mock_registry.return_value.register.call_count == 2
+            assert "mcp_srv__fetch" in mcp_mod._registered_mcp_tools
+
+    @pytest.mark.asyncio
+    async def test_replacing_manager_registers_its_tools(self, isolated_state):
+        old = MagicMock()
+        old.tools_generation = 4
+        old.get_all_tools.return_value = [("a", _make_tool("x", "a")), ("b", _make_tool("y", "b"))]
+        mcp_mod._mcp_manager = old
+
+        new = MagicMock()
+        new.tools_generation = 4
+        new.get_all_tools.return_value = [("c", _make_tool("x", "c")), ("d", _make_tool("y", "d"))]
+
+        config = MagicMock()
+        config.claude.enabled = False
+        config.claude.config_dir = None
+        config.mcp.servers = {}
+
+        with (
+            patch.object(mcp_mod, "get_registry"),
+            patch.object(mcp_mod, "MCPServerManager", return_value=new),
+            patch.object(mcp_mod, "load_all_skills", return_value=[]),
+            patch.object(mcp_mod, "load_cache", return_value=None),
+            patch.object(mcp_mod, "filter_cache_by_servers", return_value=None),
+        ):
+            mcp_mod.refresh_mcp_tools()
+            await mcp_mod.initialize_mcp(config)
+            mcp_mod.refresh_mcp_tools()
+
+        assert {"mcp_c__x", "mcp_d__y"} <= mcp_mod._registered_mcp_tools
@@ -1,12 +1,17 @@
 """Tests for the memory module (model, storage, tools)."""
 
 import json
+import os
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from wolo.memory.markdown_model import MarkdownMemory
 from wolo.memory.markdown_storage import MarkdownMemoryStorage
 from wolo.memory.model import Memory, _slugify
+from wolo.memory.scanner import MemoryScanner
 from wolo.memory.storage import MemoryStorage
 
 # ==================== Slugify Tests ====================
@@ -35,6 +40,16 @@ class TestSlugify:
         result = _slugify("处理XML报表流程")
         assert "处理XML报表流程" == result
 
+    def test_unicode_whitespace_replaced(self):
+        assert _slugify("a\u3000b\xa0c\td") == "a-b-c-d"
+
+    def test_shared_by_both_models(self):
+        from wolo.memory import markdown_model
+        from wolo.memory._slug import slugify
+
+        assert _slugify is slugify
+        assert markdown_model._slugify is slugify
+
     def test_empty_string_returns_uuid(self):
         result = _slugify("???")
         # All chars replaced with dashes, stripped → fallback to uuid hex
@@ -313,6 +328,38 @@ class TestMemoryStorage:
         results = storage.search("PYTHON")
         assert len(results) == 1
 
+    def test_search_loads_only_index_hits(self, storage: MemoryStorage):
+        """Test that search matches on the index and loads only the hits."""
+        storage.save(Memory.create(title="Python One", summary="S", content="C"))
+        storage.save(Memory.create(title="Rust", summary="S", content="C"))
+        storage.save(Memory.create(title="Python Two", summary="S", content="C"))
+
+        with patch.object(storage, "load", wraps=storage.load) as load:
+            results = storage.search("python")
+
+        assert load.call_count == 2
+        assert {m.title for m in results} == {"Python One", "Python Two"}
+
+    def test_search_uses_precomputed_text(self, storage: MemoryStorage):
+        """Test that index entries carry lower-cased search text, old ones included."""
+        mem = Memory.create(title="Python", summary="Async IO", content="C", tags=["Web"])
+        storage.save(mem)
+        assert storage._load_index()[mem.id]["search_text"] == "python\0async io\0web"
+        assert storage.search("python async") == []
+
+        # Entries written before search_text existed still match
+        storage._write_index(
+            {mem.id: {k: v for k, v in storage._load_index()[mem.id].items() if k != "search_text"}}
+        )
+        assert [m.id for m in storage.search("WEB")] == [mem.id]
+
+    def test_search_without_index_scans_files(self, storage: MemoryStorage):
+        """Test that search falls back to reading files when there is no index."""
+        storage.save(Memory.create(title="Python", summary="S", content="C"))
+        storage._index_file().unlink()
+
+        assert [m.title for m in storage.search("python")] == ["Python"]
+
     def test_storage_creates_directory(self, tmp_path: Path):
         """Test that storage creates the base directory if it doesn't exist."""
         storage_dir = tmp_path / "new" / "nested" / "memories"
@@ -339,6 +386,133 @@ class TestMemoryStorage:
         assert index is not None
         assert mem.id not in index
 
+    def test_concurrent_saves_all_indexed(self, storage: MemoryStorage):
+        """Test that concurrent saves don't lose each other's index updates."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        memories = [Memory.create(title=f"M{i}", summary="S", content="C") for i in range(16)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(storage.save, memories))
+
+        assert set(storage._load_index()) == {m.id for m in memories}
+        assert not list(storage.base_dir.glob("*.tmp"))
+
+    def test_fsync_opt_in(self, tmp_path: Path, monkeypatch):
+        """Test that writes only fsync when enabled."""
+        monkeypatch.delenv("WOLO_MEMORY_FSYNC", raising=False)
+        mem = Memory.create(title="T", summary="S", content="C")
+
+        with patch("wolo.memory.storage.os.fsync") as fsync:
+            MemoryStorage(base_dir=tmp_path).save(mem)
+            fsync.assert_not_called()
+
+            MemoryStorage(base_dir=tmp_path, fsync=True).save(mem)
+            assert fsync.call_count == 2  # memory file and index
+
+            fsync.reset_mock()
+            monkeypatch.setenv("WOLO_MEMORY_FSYNC", "1")
+            MemoryStorage(base_dir=tmp_path).save(mem)
+            assert fsync.call_count == 2
+
+            fsync.reset_mock()
+            MemoryStorage(base_dir=tmp_path).flush_durable()
+            fsync.assert_called_once()
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_roundtrip_with_and_without_orjson(
+        self, storage: MemoryStorage, monkeypatch, use_orjson: bool
+    ):
+        """Test that memory files read and write with either JSON backend."""
+        from wolo import _json
+
+        if not use_orjson:
+            monkeypatch.setattr(_json, "orjson", None)
+        elif _json.orjson is None:
+            pytest.skip("orjson not installed")
+
+        mem = Memory.create(title="Unicode 中文", summary="S", content="C")
+        storage.save(mem)
+        assert storage.load(mem.id).title == "Unicode 中文"
+        assert json.loads(storage._memory_file(mem.id).read_text(encoding="utf-8"))["id"] == mem.id
+
+        storage._memory_file(mem.id).write_text("{broken")
+        assert storage.load(mem.id) is None
+
+    def test_index_appends_and_compacts(self, storage: MemoryStorage):
+        """Test that index updates append records and compact when superseded."""
+        mem = Memory.create(title="Edited", summary="S", content="C")
+        index_file = storage._index_file()
+
+        storage.save(mem)
+        size = index_file.stat().st_size
+        storage.save(mem)
+        assert index_file.stat().st_size > size  # appended, not rewritten
+
+        from wolo.memory.storage import INDEX_COMPACT_SLACK
+
+        for _ in range(INDEX_COMPACT_SLACK + 2):
+            storage.save(mem)
+        assert list(storage._load_index()) == [mem.id]
+        assert storage._read_index_records()[1] == 1
+
+    def test_index_ignores_torn_tail(self, storage: MemoryStorage):
+        """Test that a partially written final record doesn't lose the index."""
+        mem = Memory.create(title="Kept", summary="S", content="C")
+        storage.save(mem)
+        with open(storage._index_file(), "ab") as f:
+            f.write(b'["torn", {"ti')
+
+        assert list(storage._load_index()) == [mem.id]
+
+    def test_first_index_covers_existing_memories(self, storage: MemoryStorage):
+        """Test that the first index write includes memories saved before it."""
+        storage.save(Memory.create(title="Python Old", summary="S", content="C"))
+        storage._index_file().unlink()
+
+        storage.save(Memory.create(title="Rust", summary="S", content="C"))
+
+        assert [m.title for m in storage.search("python")] == ["Python Old"]
+        assert len(storage._load_index()) == 2
+
+    def test_damaged_index_is_rebuilt(self, storage: MemoryStorage):
+        """Test that a torn record mid-file triggers a rebuild from the memory files."""
+        first = Memory.create(title="First", summary="S", content="C")
+        storage.save(first)
+        with open(storage._index_file(), "ab") as f:
+            f.write(b'["torn", {"ti')
+        second = Memory.create(title="Second", summary="S", content="C")
+        storage.save(second)
+
+        assert set(storage._load_index()) == {first.id, second.id}
+        assert storage._read_index_records()[2] is False
+
+    def test_legacy_json_index_converted(self, storage: MemoryStorage):
+        """Test that an index.json from older versions is converted and kept."""
+        legacy = {
+            "abc": {"id": "abc", "title": "Old", "summary": "S", "tags": [], "created_at": 1.0}
+        }
+        (storage.base_dir / "index.json").write_text(json.dumps(legacy))
+
+        assert storage._load_index() == legacy
+        assert (storage.base_dir / "index.json").exists()
+        assert (storage.base_dir / "index.jsonl").exists()
+        assert storage._load_index() == legacy
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_index_is_json_lines(self, storage: MemoryStorage, monkeypatch, use_orjson: bool):
+        """Test that index records are plain JSON lines with either JSON backend."""
+        from wolo import _json
+
+        if not use_orjson:
+            monkeypatch.setattr(_json, "orjson", None)
+        mem = Memory.create(title="Unicode 中文", summary="S", content="C")
+        storage.save(mem)
+        storage.delete(mem.id)
+
+        lines = storage._index_file().read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines][-1] == [mem.id, None]
+        assert json.loads(lines[0])[1]["title"] == "Unicode 中文"
+
     def test_file_persistence(self, storage: MemoryStorage):
         """Test that memories are persisted to JSON files."""
         mem = Memory.create(title="Persistent", summary="S", content="C")
@@ -354,6 +528,442 @@ class TestMemoryStorage:
         assert data["title"] == "Persistent"
 
 
+# ==================== Markdown Model Tests ====================
+
+
+class TestMarkdownMemoryModel:
+    """Tests for MarkdownMemory parsing and serialization."""
+
+    def test_from_file_parses_frontmatter(self, tmp_path: Path):
+        path = tmp_path / "memory-x.md"
+        path.write_text(
+            "---\n"
+            "title: Pasta: the basics  \n"
+            "tags: [cooking, 'italian']\n"
+            "created_at: 2026-02-12T10:30:00\n"
+            "updated_at: 2026-02-13T08:00:00.123456\n"
+            "source_session: null\n"
+            "---\n\n# Body\n",
+            encoding="utf-8",
+        )
+
+        mem = MarkdownMemory.from_file(path)
+        assert mem.id == "memory-x"
+        assert mem.title == "Pasta: the basics"
+        assert mem.tags == ["cooking", "italian"]
+        assert mem.created_at == datetime(2026, 2, 12, 10, 30)
+        assert mem.updated_at == datetime(2026, 2, 13, 8, 0, 0, 123456)
+        assert mem.source_session is None
+        assert mem.content == "# Body"
+
+    def test_from_file_timestamp_fallbacks(self, tmp_path: Path):
+        path = tmp_path / "memory-ts.md"
+        path.write_text("---\ntitle: T\ncreated_at: not-a-date\n---\n\nBody", encoding="utf-8")
+
+        before = datetime.now()
+        mem = MarkdownMemory.from_file(path)
+        assert mem.created_at >= before
+        assert mem.updated_at >= before
+
+    def test_from_file_normalizes_crlf(self, tmp_path: Path):
+        path = tmp_path / "memory-crlf.md"
+        path.write_bytes(b"---\r\ntitle: Windows\r\ntags: [a]\r\n---\r\n\r\nline1\r\nline2\r\n")
+
+        mem = MarkdownMemory.from_file(path)
+        assert mem.title == "Windows"
+        assert mem.content == "line1\nline2"
+
+    def test_from_file_rejects_missing_frontmatter(self, tmp_path: Path):
+        path = tmp_path / "memory-bad.md"
+        path.write_text("# No frontmatter", encoding="utf-8")
+        with pytest.raises(ValueError):
+            MarkdownMemory.from_file(path)
+
+    def test_search_text_cached_until_save(self, tmp_path: Path):
+        mem = MarkdownMemory.create(base_dir=tmp_path, title="Mixed Case", content="Body TEXT")
+        mem.tags = ["Tag", "Two"]
+
+        header = mem.search_header
+        assert header == "mixed case\0tag\0two"
+        assert mem.search_header is header
+        assert mem.content_lower == "body text"
+
+        mem.title = "Renamed"
+        mem.save()
+        assert mem.search_header.startswith("renamed\0")
+
+    def test_large_body_loaded_on_first_access(self, tmp_path: Path):
+        body = "x" * 10000
+        path = tmp_path / "memory-big.md"
+        path.write_text(f"---\ntitle: Big\ntags: []\n---\n\n{body}\n", encoding="utf-8")
+
+        mem = MarkdownMemory.from_file(path)
+        assert mem.title == "Big"
+        assert mem._body is None
+        assert mem.content == body
+        assert mem._body == body
+
+    def test_equality_and_repr_include_body(self, tmp_path: Path):
+        path = tmp_path / "memory-big.md"
+        path.write_text(
+            "---\ntitle: Big\ncreated_at: 2026-01-01T00:00:00\n"
+            f"updated_at: 2026-01-01T00:00:00\n---\n\n{'A' * 5000}",
+            encoding="utf-8",
+        )
+        now = datetime(2026, 1, 1)
+        a = MarkdownMemory(tmp_path / "m.md", "T", [], now, now, content="one")
+        b = MarkdownMemory(tmp_path / "m.md", "T", [], now, now, content="two")
+
+        assert a != b
+        assert a == MarkdownMemory(tmp_path / "m.md", "T", [], now, now, content="one")
+        assert "content='one'" in repr(a)
+        # A deferred body is loaded for the comparison
+        assert MarkdownMemory.from_file(path) == MarkdownMemory.from_file(path)
+        assert MarkdownMemory.from_file(path)._body is None
+        assert "A" * 5000 in repr(MarkdownMemory.from_file(path))
+
+    def test_deferred_body_after_external_edit(self, tmp_path: Path):
+        body = "A" * 5000
+        path = tmp_path / "memory-big.md"
+        path.write_text(f"---\ntitle: Big\n---\n\n{body}", encoding="utf-8")
+        mem = MarkdownMemory.from_file(path)
+
+        path.write_text(
+            f"---\ntitle: A much longer title\ntags: [x]\n---\n\n{body}", encoding="utf-8"
+        )
+        assert mem.content == body
+
+    def test_deferred_body_after_external_delete(self, tmp_path: Path):
+        path = tmp_path / "memory-big.md"
+        path.write_text(f"---\ntitle: Big\n---\n\n{'A' * 5000}", encoding="utf-8")
+        mem = MarkdownMemory.from_file(path)
+
+        path.unlink()
+        assert mem.content == ""
+
+    def test_save_keeps_deferred_body(self, tmp_path: Path):
+        body = "line\r\n" * 2000
+        path = tmp_path / "memory-big.md"
+        path.write_bytes(f"---\r\ntitle: Big\r\n---\r\n\r\n{body}".encode())
+
+        mem = MarkdownMemory.from_file(path)
+        mem.title = "Renamed"
+        mem.save()
+
+        loaded = MarkdownMemory.from_file(path)
+        assert loaded.title == "Renamed"
+        assert loaded.content == body.replace("\r\n", "\n").strip()
+
+    def test_uses_slots(self, tmp_path: Path):
+        mem = MarkdownMemory.create(base_dir=tmp_path, title="Slots", content="C")
+        assert not hasattr(mem, "__dict__")
+        assert not hasattr(Memory.create(title="T", summary="S", content="C"), "__dict__")
+
+    def test_roundtrip(self, tmp_path: Path):
+        mem = MarkdownMemory.create(
+            base_dir=tmp_path,
+            title="Roundtrip",
+            content="## Notes\n\nSome content",
+            tags=["a", "b"],
+            source_session="Agent_260212_103000",
+        )
+        mem.save()
+
+        loaded = MarkdownMemory.from_file(mem.file_path)
+        assert loaded.title == mem.title
+        assert loaded.tags == mem.tags
+        assert loaded.created_at == mem.created_at
+        assert loaded.updated_at == mem.updated_at
+        assert loaded.source_session == mem.source_session
+        assert loaded.content == mem.content
+
+
+# ==================== Markdown Storage Tests ====================
+
+
+class TestMarkdownMemoryStorage:
+    """Tests for MarkdownMemoryStorage."""
+
+    @pytest.fixture
+    def storage(self, tmp_path: Path) -> MarkdownMemoryStorage:
+        return MarkdownMemoryStorage(base_dir=tmp_path / "memories")
+
+    def test_scan_ignores_non_markdown(self, storage: MarkdownMemoryStorage):
+        storage.create_memory(title="Keep", content="C")
+        (storage.base_dir / "notes.txt").write_text("not a memory")
+        (storage.base_dir / "dir.md").mkdir()
+
+        memories = storage.scan_memories()
+        assert [m.title for m in memories] == ["Keep"]
+
+    def test_scan_reuses_cached_memory_from_create(self, storage: MarkdownMemoryStorage):
+        mem = storage.create_memory(title="Cached", content="C")
+
+        memories = storage.scan_memories()
+        assert memories[0] is mem
+        assert list(storage._cache) == [str(mem.file_path)]
+
+    def test_create_memory_caches_file_mtime(self, storage: MarkdownMemoryStorage):
+        mem = storage.create_memory(title="Mtime", content="C")
+
+        cached_mtime, cached = storage._cache[str(mem.file_path)]
+        assert cached is mem
+        assert cached_mtime == mem.file_path.stat().st_mtime
+
+    def test_get_memory_from_cache_and_disk(self, storage: MarkdownMemoryStorage):
+        mem = storage.create_memory(title="Lookup", content="C")
+        assert storage.get_memory(mem.id) is mem
+
+        fresh = MarkdownMemoryStorage(base_dir=storage.base_dir)
+        loaded = fresh.get_memory(mem.id)
+        assert loaded is not None
+        assert loaded.title == "Lookup"
+        assert fresh.get_memory(mem.id) is loaded
+
+    def test_get_memory_missing_or_invalid_id(self, storage: MarkdownMemoryStorage):
+        storage.create_memory(title="Exists", content="C")
+        assert storage.get_memory("memory-nope") is None
+        assert storage.get_memory("") is None
+        assert storage.get_memory("../memories/x") is None
+
+    def test_delete_memory(self, storage: MarkdownMemoryStorage):
+        mem = storage.create_memory(title="Doomed", content="C")
+        storage.scan_memories()
+
+        assert storage.delete_memory(mem.id) is True
+        assert not mem.file_path.exists()
+        assert storage._cache == {}
+        assert storage.scan_memories() == []
+
+        assert storage.delete_memory(mem.id) is False
+        assert storage.delete_memory("../memories/x") is False
+
+    def test_search_matches_title_tags_and_content(self, storage: MarkdownMemoryStorage):
+        storage.create_memory(title="Python async", content="event loop")
+        storage.create_memory(title="Cooking", content="pasta", tags=["Italian"])
+        storage.create_memory(title="Notes", content="About PYTHON typing")
+
+        assert {m.title for m in storage.search("python")} == {"Python async", "Notes"}
+        assert [m.title for m in storage.search("italian")] == ["Cooking"]
+        assert storage.search("nothing") == []
+        # A match can't span the title and a tag
+        assert storage.search("cooking italian") == []
+
+    def test_search_results_newest_first(self, storage: MarkdownMemoryStorage):
+        for i, day in enumerate([3, 1, 2]):
+            MarkdownMemory(
+                file_path=storage.base_dir / f"memory-{i}.md",
+                title=f"match {day}",
+                tags=[],
+                created_at=datetime(2026, 1, day),
+                updated_at=datetime(2026, 1, day),
+            ).save()
+
+        assert [m.title for m in storage.search("match")] == ["match 3", "match 2", "match 1"]
+
+    def test_scan_drops_deleted_files_from_cache(self, storage: MarkdownMemoryStorage):
+        mem = storage.create_memory(title="Gone", content="C")
+        assert len(storage.scan_memories()) == 1
+
+        mem.file_path.unlink()
+        assert storage.scan_memories() == []
+        assert storage._cache == {}
+        assert storage._sorted == []
+
+    def test_scan_keeps_sorted_index_across_changes(self, storage: MarkdownMemoryStorage):
+        def write(name: str, day: int) -> Path:
+            path = storage.base_dir / f"memory-{name}.md"
+            MarkdownMemory(
+                file_path=path,
+                title=name,
+                tags=[],
+                created_at=datetime(2026, 1, day),
+                updated_at=datetime(2026, 1, day),
+            ).save()
+            return path
+
+        write("a", 1)
+        b = write("b", 3)
+        write("c", 2)
+        assert [m.title for m in storage.scan_memories()] == ["b", "c", "a"]
+
+        # Rewrite b as the oldest memory and drop c
+        b.write_text("---\ntitle: b\ncreated_at: 2025-12-01T00:00:00\n---\n\nC", encoding="utf-8")
+        stat = b.stat()
+        os.utime(b, (stat.st_atime, stat.st_mtime + 10))
+        (storage.base_dir / "memory-c.md").unlink()
+
+        assert [m.title for m in storage.scan_memories()] == ["a", "b"]
+        assert len(storage._sorted) == len(storage._cache) == 2
+
+    def test_scan_reloads_modified_files(self, storage: MarkdownMemoryStorage):
+        mem = storage.create_memory(title="Original", content="C")
+        storage.scan_memories()
+
+        mem.title = "Edited"
+        mem.save()
+        stat = mem.file_path.stat()
+        os.utime(mem.file_path, (stat.st_atime, stat.st_mtime + 10))
+
+        assert storage.scan_memories()[0].title == "Edited"
+
+
+# ==================== Migration Tests ====================
+
+
+class TestMigrateJsonToMarkdown:
+    """Tests for migrate_json_to_markdown."""
+
+    def test_migrates_json_memories(self, tmp_path: Path):
+        from wolo.memory.migrate import migrate_json_to_markdown
+
+        old_dir = tmp_path / "old"
+        legacy = MemoryStorage(base_dir=old_dir)
+        mem = Memory.create(title="Legacy", summary="S", content="Old content", tags=["x"])
+        legacy.save(mem)
+        (old_dir / "broken.json").write_text("{not json")
+
+        new_dir = tmp_path / "new"
+        assert migrate_json_to_markdown(old_dir, new_dir) == 1
+
+        migrated = MarkdownMemory.from_file(new_dir / f"memory-{mem.id}.md")
+        assert migrated.title == "Legacy"
+        assert migrated.tags == ["x"]
+        assert migrated.content == "Old content"
+
+    def test_dry_run_writes_nothing(self, tmp_path: Path):
+        from wolo.memory.migrate import migrate_json_to_markdown
+
+        old_dir = tmp_path / "old"
+        MemoryStorage(base_dir=old_dir).save(Memory.create(title="T", summary="S", content="C"))
+
+        new_dir = tmp_path / "new"
+        assert migrate_json_to_markdown(old_dir, new_dir, dry_run=True) == 1
+        assert not new_dir.exists()
+
+
+# ==================== Memory Scanner Tests ====================
+
+
+class TestMemoryScanner:
+    """Tests for MemoryScanner context formatting."""
+
+    @pytest.fixture
+    def storage(self, tmp_path: Path) -> MarkdownMemoryStorage:
+        return MarkdownMemoryStorage(base_dir=tmp_path / "memories")
+
+    def test_no_memories_returns_none(self, storage: MarkdownMemoryStorage):
+        assert MemoryScanner(storage).scan_and_format() is None
+
+    def test_empty_dir_skips_storage_scan(self, storage: MarkdownMemoryStorage):
+        with patch.object(storage, "scan_memories") as scan:
+            assert MemoryScanner(storage).scan_and_format() is None
+            scan.assert_not_called()
+
+    def test_formats_memories(self, storage: MarkdownMemoryStorage):
+        storage.create_memory(title="Pasta", content="Boil water", tags=["cooking"])
+
+        context = MemoryScanner(storage).scan_and_format()
+        assert context.startswith("# Long-Term Memory\n")
+        assert "## Pasta\n(tags: cooking)\n\nBoil water\n\n---\n" in context
+
+    def test_probe_reports_newest_mtime_and_count(self, storage: MarkdownMemoryStorage):
+        scanner = MemoryScanner(storage)
+        assert scanner._probe_dir() == (0.0, 0)
+
+        old = storage.create_memory(title="Old", content="C").file_path
+        new = storage.create_memory(title="New", content="C").file_path
+        os.utime(old, (1000.0, 1000.0))
+        os.utime(new, (2000.0, 2000.0))
+        (storage.base_dir / "notes.txt").write_text("ignored")
+        os.utime(storage.base_dir / "notes.txt", (3000.0, 3000.0))
+
+        assert scanner._probe_dir() == (2000.0, 2)
+
+    def test_probe_skips_file_deleted_mid_scan(self, storage: MarkdownMemoryStorage):
+        gone = storage.create_memory(title="Gone", content="C").file_path
+        storage.create_memory(title="Kept", content="C")
+        real_iter = storage._iter_md_entries
+
+        def iter_then_delete():
+            entries = list(real_iter())
+            gone.unlink(missing_ok=True)
+            return iter(entries)
+
+        scanner = MemoryScanner(storage)
+        with patch.object(storage, "_iter_md_entries", side_effect=iter_then_delete):
+            assert scanner._probe_dir()[1] == 1
+            assert "## Kept" in scanner.scan_and_format()
+
+    def test_recent_context_served_without_probe(self, storage: MarkdownMemoryStorage):
+        storage.create_memory(title="First", content="C")
+        scanner = MemoryScanner(storage)
+        context = scanner.scan_and_format()
+
+        with patch.object(scanner, "_probe_dir") as probe:
+            assert scanner.scan_and_format() is context
+            probe.assert_not_called()
+
+        storage.create_memory(title="Second", content="C")
+        scanner.invalidate_cache()
+        assert "## Second" in scanner.scan_and_format()
+
+    def test_only_changed_memories_reformatted(self, storage: MarkdownMemoryStorage):
+        storage.create_memory(title="Keep", content="C")
+        scanner = MemoryScanner(storage)
+        scanner.scan_and_format()
+
+        storage.create_memory(title="Added", content="C")
+        scanner.invalidate_cache()
+        with patch.object(scanner, "_format_memory", wraps=scanner._format_memory) as fmt:
+            context = scanner.scan_and_format()
+
+        assert [c.args[0].title for c in fmt.call_args_list] == ["Added"]
+        assert "## Keep" in context and "## Added" in context
+        assert len(scanner._block_cache) == 2
+
+    def test_storage_writes_invalidate_context(self, storage: MarkdownMemoryStorage):
+        first = storage.create_memory(title="First", content="C")
+        scanner = MemoryScanner(storage)
+        assert "## First" in scanner.scan_and_format()
+
+        # Same-second writes and deletes are seen without invalidate_cache()
+        second = storage.create_memory(title="Second", content="C")
+        os.utime(second.file_path, (first.file_path.stat().st_mtime,) * 2)
+        assert "## Second" in scanner.scan_and_format()
+
+        storage.delete_memory(second.id)
+        assert "## Second" not in scanner.scan_and_format()
+
+    def test_external_delete_detected_by_file_count(self, storage: MarkdownMemoryStorage):
+        newest = storage.create_memory(title="Newest", content="C")
+        older = storage.create_memory(title="Older", content="C")
+        os.utime(newest.file_path, (2000.0, 2000.0))
+        os.utime(older.file_path, (1000.0, 1000.0))
+        scanner = MemoryScanner(storage)
+        assert "## Older" in scanner.scan_and_format()
+
+        older.file_path.unlink()
+        scanner._last_probe_monotonic = 0.0
+        assert "## Older" not in scanner.scan_and_format()
+
+    def test_long_memory_content_capped(self, storage: MarkdownMemoryStorage):
+        storage.create_memory(title="Long", content="y" * 6000)
+
+        context = MemoryScanner(storage).scan_and_format()
+        assert "\n" + "y" * 5000 + "\n...[truncated]\n\n---\n" in context
+        assert "y" * 5001 not in context
+
+    def test_truncates_at_char_limit(self, storage: MarkdownMemoryStorage, monkeypatch):
+        storage.create_memory(title="Big", content="x" * 4000)
+        monkeypatch.setattr(MemoryScanner, "MAX_MEMORY_CHARS", 1000)
+
+        context = MemoryScanner(storage).scan_and_format()
+        assert context.endswith("\n...[truncated]")
+        body = context.split("## Big", 1)[1]
+        assert len("## Big" + body) == 1000 + len("\n...[truncated]")
+
+
 # ==================== Memory Tool Tests ====================
 
 
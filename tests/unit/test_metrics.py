@@ -82,6 +82,23 @@ class TestSessionMetrics:
         assert session.total_tokens == 1500
         assert session.avg_llm_latency_ms == 0  # No steps recorded
 
+    def test_avg_llm_latency_over_recorded_steps(self):
+        """Test that the average LLM latency covers every recorded step."""
+        session = SessionMetrics(session_id="test", agent_type="general", start_time=datetime.now())
+        for number, latency in enumerate([1000, 500, 1500], start=1):
+            session.record_step(
+                StepMetrics(
+                    step_number=number,
+                    llm_latency_ms=latency,
+                    prompt_tokens=0,
+                    completion_tokens=0,
+                    tool_calls=[],
+                    tool_duration_ms=0,
+                )
+            )
+
+        assert session.avg_llm_latency_ms == 1000
+
     def test_record_step(self):
         """Test recording a step."""
         session = SessionMetrics(session_id="test", agent_type="general", start_time=datetime.now())
@@ -169,6 +186,49 @@ class TestSessionMetrics:
         assert "subagent_count" in result
 
 
+class TestMetricsSlots:
+    """Tests that the per-step and per-session records use slots."""
+
+    def test_no_instance_dict(self):
+        """Test that metrics instances carry no __dict__."""
+        step = StepMetrics(
+            step_number=1,
+            llm_latency_ms=1.0,
+            prompt_tokens=1,
+            completion_tokens=1,
+            tool_calls=[],
+            tool_duration_ms=0.0,
+        )
+        session = SessionMetrics(session_id="s", agent_type="general", start_time=datetime.now())
+        assert not hasattr(step, "__dict__")
+        assert not hasattr(session, "__dict__")
+
+
+class TestSessionCounters:
+    """Tests for per-name counters exported by SessionMetrics."""
+
+    def test_counters_export_as_plain_dicts(self):
+        """Test that to_dict and the report show plain dicts, not Counters."""
+        session = SessionMetrics(session_id="s", agent_type="general", start_time=datetime.now())
+        session.record_step(
+            StepMetrics(
+                step_number=1,
+                llm_latency_ms=1.0,
+                prompt_tokens=1,
+                completion_tokens=1,
+                tool_calls=[{"tool": "read"}, {"function": {"name": "grep"}}, {}],
+                tool_duration_ms=0.0,
+            )
+        )
+        session.record_tool_error("read", "timeout")
+
+        data = session.to_dict()
+        assert type(data["tools_by_name"]) is dict
+        assert data["tools_by_name"] == {"read": 1, "grep": 1, "unknown": 1}
+        assert type(data["errors_by_category"]) is dict
+        assert "Counter" not in generate_report([data])
+
+
 class TestMetricsCollector:
     """Tests for MetricsCollector singleton."""
 
@@ -178,6 +238,12 @@ class TestMetricsCollector:
         collector2 = MetricsCollector()
         assert collector1 is collector2
 
+    def test_sessions_are_instance_state(self):
+        """Test that the sessions dict lives on the instance, not the class."""
+        collector = MetricsCollector()
+        assert "_sessions" in vars(collector)
+        assert "_sessions" not in vars(MetricsCollector)
+
     def test_create_session(self):
         """Test creating a metrics session."""
         collector = MetricsCollector()
@@ -271,6 +337,19 @@ class TestMetricsCollector:
         assert len(data) == 1
         assert data[0]["session_id"] == "test-id"
 
+    def test_save_to_file_without_orjson(self, tmp_path, monkeypatch):
+        """Test that saving falls back to stdlib json."""
+        from wolo import _json
+
+        monkeypatch.setattr(_json, "orjson", None)
+        collector = MetricsCollector()
+        collector.clear()
+        collector.create_session("test-id", "general")
+
+        output_file = tmp_path / "metrics.json"
+        collector.save_to_file(str(output_file))
+        assert json.loads(output_file.read_text())[0]["session_id"] == "test-id"
+
 
 class TestGenerateReport:
     """Tests for the generate_report function."""
@@ -1,5 +1,9 @@
 """Tests for execution modes (simplified)."""
 
+import dataclasses
+
+import pytest
+
 from wolo.modes import ExecutionMode, ModeConfig, QuotaConfig
 
 
@@ -34,6 +38,17 @@ def test_mode_config_repl():
     assert config.exit_after_task is False
 
 
+def test_mode_config_shared_and_frozen():
+    """Test that for_mode returns one immutable config per mode."""
+    config = ModeConfig.for_mode(ExecutionMode.COOP)
+    assert ModeConfig.for_mode(ExecutionMode.COOP) is config
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.enable_question_tool = False
+
+    with pytest.raises(ValueError):
+        ModeConfig.for_mode("coop")
+
+
 def test_quota_config():
     """Test QuotaConfig."""
     quota = QuotaConfig(max_steps=50)
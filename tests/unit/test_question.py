@@ -147,6 +147,24 @@ class TestHasPendingQuestions:
         """No pending questions."""
         assert has_pending_questions("nonexistent_session") is False
 
+    @pytest.mark.asyncio
+    async def test_pending_until_answered(self):
+        """Tracked per session while a question waits, cleared once answered."""
+        task = asyncio.create_task(
+            ask_questions("pending_session", [QuestionInfo(question="Test?")], timeout=5.0)
+        )
+        await asyncio.sleep(0.1)
+
+        assert has_pending_questions("pending_session") is True
+        # Session IDs are matched exactly, not by prefix
+        assert has_pending_questions("pending") is False
+
+        (qid,) = get_pending_questions_ids()
+        submit_answers(qid, [["yes"]])
+        await task
+
+        assert has_pending_questions("pending_session") is False
+
 
 # Helper to get pending question IDs
 def get_pending_questions_ids():
@@ -0,0 +1,59 @@
+"""JSON encoding shared by the modules that read and write JSON files.
+
+orjson is used when it is installed (``pip install mbos-wolo[fast]``);
+otherwise the stdlib json module produces the same data.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps_bytes(
+    obj: Any, *, indent: bool = False, default: Callable[[Any], Any] | None = None
+) -> bytes:
+    """Serialize a value to UTF-8 encoded JSON.
+
+    Args:
+        obj: Value to serialize; non-string dict keys are converted like json.dumps does
+        indent: Indent nested values by two spaces instead of writing compact JSON
+        default: Called for objects that aren't natively serializable
+
+    Returns:
+        The JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=default, option=option)
+    text = json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        default=default,
+        ensure_ascii=False,
+    )
+    return text.encode("utf-8")
+
+
+def loads(data: bytes | str) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON as bytes or str
+
+    Returns:
+        The parsed value
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
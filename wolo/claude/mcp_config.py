@@ -186,6 +186,11 @@ def merge_mcp_configs(
     Returns:
         Merged server configurations
     """
-    merged = dict(claude_servers)
-    merged.update(wolo_servers)  # Wolo configs override
-    return merged
+    # Common case: only one source is configured
+    if not claude_servers:
+        return dict(wolo_servers)
+    if not wolo_servers:
+        return dict(claude_servers)
+
+    # Configs are flat per server name, so a shallow merge suffices
+    return {**claude_servers, **wolo_servers}  # Wolo configs override
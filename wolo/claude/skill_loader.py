@@ -16,7 +16,10 @@ Format:
 """
 
 import logging
+import os
 import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -29,6 +32,9 @@ logger = logging.getLogger(__name__)
 WOLO_SKILLS_DIR = Path.home() / ".wolo" / "skills"
 CLAUDE_SKILLS_DIR = Path.home() / ".claude" / "skills"
 
+# Upper bound on threads used to read SKILL.md files in parallel
+MAX_SKILL_LOAD_WORKERS = 8
+
 
 @dataclass
 class ClaudeSkill:
@@ -198,6 +204,47 @@ def load_skill(skill_dir: Path) -> ClaudeSkill | None:
         return None
 
 
+def _list_skill_dirs(skills_dir: Path) -> list[Path]:
+    """
+    List candidate skill directories under a skills directory.
+
+    Args:
+        skills_dir: Path to skills directory
+
+    Returns:
+        Non-hidden subdirectories, or an empty list if skills_dir is missing
+    """
+    try:
+        with os.scandir(skills_dir) as entries:
+            return [
+                Path(entry.path)
+                for entry in entries
+                if not entry.name.startswith(".") and entry.is_dir()
+            ]
+    except FileNotFoundError:
+        logger.debug(f"Skills directory not found: {skills_dir}")
+        return []
+    except NotADirectoryError:
+        return []
+
+
+def _collect_skills(loaded: Iterable[ClaudeSkill | None]) -> dict[str, ClaudeSkill]:
+    """
+    Collect successfully loaded skills by name.
+
+    Args:
+        loaded: Results of load_skill, in directory order
+
+    Returns:
+        Dict mapping skill name to skill object
+    """
+    skills = {}
+    for skill in loaded:
+        if skill:
+            skills[skill.name] = skill
+    return skills
+
+
 def _load_skills_from_dir(skills_dir: Path) -> dict[str, ClaudeSkill]:
     """
     Load skills from a single directory.
@@ -208,18 +255,12 @@ def _load_skills_from_dir(skills_dir: Path) -> dict[str, ClaudeSkill]:
     Returns:
         Dict mapping skill name to skill object
     """
-    if not skills_dir.exists():
-        logger.debug(f"Skills directory not found: {skills_dir}")
+    skill_dirs = _list_skill_dirs(skills_dir)
+    if not skill_dirs:
         return {}
 
-    skills = {}
-    for item in skills_dir.iterdir():
-        if item.is_dir() and not item.name.startswith("."):
-            skill = load_skill(item)
-            if skill:
-                skills[skill.name] = skill
-
-    return skills
+    with ThreadPoolExecutor(max_workers=min(MAX_SKILL_LOAD_WORKERS, len(skill_dirs))) as pool:
+        return _collect_skills(pool.map(load_skill, skill_dirs))
 
 
 def load_claude_skills(skills_dir: Path | None = None) -> list[ClaudeSkill]:
@@ -266,27 +307,38 @@ def load_all_skills(
     wolo_dir = wolo_skills_dir or WOLO_SKILLS_DIR
     claude_dir = claude_skills_dir or CLAUDE_SKILLS_DIR
 
-    # Load Wolo skills first (highest priority)
-    skills = _load_skills_from_dir(wolo_dir)
-    wolo_count = len(skills)
+    with ThreadPoolExecutor(max_workers=MAX_SKILL_LOAD_WORKERS) as pool:
+        # Walk both directory trees concurrently
+        wolo_listing = pool.submit(_list_skill_dirs, wolo_dir)
+        claude_listing = pool.submit(_list_skill_dirs, claude_dir) if claude_enabled else None
+
+        # Parse SKILL.md files from both trees in parallel (map submits eagerly)
+        wolo_loaded = pool.map(load_skill, wolo_listing.result())
+        claude_loaded = (
+            pool.map(load_skill, claude_listing.result()) if claude_listing is not None else None
+        )
+
+        # Collect Wolo skills first (highest priority)
+        skills = _collect_skills(wolo_loaded)
+        wolo_count = len(skills)
 
-    if wolo_count > 0:
-        logger.info(f"Loaded {wolo_count} skills from {wolo_dir}")
+        if wolo_count > 0:
+            logger.info(f"Loaded {wolo_count} skills from {wolo_dir}")
 
-    # Load Claude skills if enabled (skip duplicates)
-    if claude_enabled:
-        claude_skills = _load_skills_from_dir(claude_dir)
-        claude_added = 0
+        # Load Claude skills if enabled (skip duplicates)
+        if claude_loaded is not None:
+            claude_skills = _collect_skills(claude_loaded)
+            claude_added = 0
 
-        for name, skill in claude_skills.items():
-            if name not in skills:
-                skills[name] = skill
-                claude_added += 1
-            else:
-                logger.debug(f"Skipping duplicate skill from Claude: {name}")
+            for name, skill in claude_skills.items():
+                if name not in skills:
+                    skills[name] = skill
+                    claude_added += 1
+                else:
+                    logger.debug(f"Skipping duplicate skill from Claude: {name}")
 
-        if claude_added > 0:
-            logger.info(f"Loaded {claude_added} additional skills from {claude_dir}")
+            if claude_added > 0:
+                logger.info(f"Loaded {claude_added} additional skills from {claude_dir}")
 
     return list(skills.values())
 
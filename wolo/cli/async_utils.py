@@ -4,12 +4,13 @@ Utilities for async execution with proper error handling.
 
 import asyncio
 import logging
+import sys
 from collections.abc import Awaitable
 from typing import TypeVar
 
-try:
+if sys.version_info >= (3, 11):
     from builtins import BaseExceptionGroup
-except ImportError:
+else:
     from exceptiongroup import BaseExceptionGroup
 
 logger = logging.getLogger(__name__)
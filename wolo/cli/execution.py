@@ -158,6 +158,11 @@ async def run_single_task_mode(
             logger.warning(f"Failed to stop watch server: {e}")
         set_watch_server(None, None)
 
+        # Close the PathGuard audit log
+        from wolo.tools_pkg.path_guard_executor import close_path_guard_middleware
+
+        close_path_guard_middleware()
+
         # Close HTTP connections
         await WoloLLMClient.close_all_sessions()
 
@@ -300,6 +305,11 @@ async def run_repl_mode(
             logger.warning(f"Failed to stop watch server: {e}")
         set_watch_server(None, None)
 
+        # Close the PathGuard audit log
+        from wolo.tools_pkg.path_guard_executor import close_path_guard_middleware
+
+        close_path_guard_middleware()
+
         # Close HTTP connections
         await WoloLLMClient.close_all_sessions()
 
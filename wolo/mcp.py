@@ -1,115 +0,0 @@
-"""MCP (Model Context Protocol) integration for Wolo.
-
-This module provides basic support for connecting to MCP servers
-and exposing their tools to the Wolo agent.
-"""
-
-import logging
-from typing import Any
-
-logger = logging.getLogger(__name__)
-
-
-class MCPClient:
-    """Basic MCP client for connecting to MCP servers."""
-
-    def __init__(self, server_url: str):
-        """Initialize MCP client.
-
-        Args:
-            server_url: URL of the MCP server
-        """
-        self.server_url = server_url
-        self._tools: list[dict[str, Any]] = []
-
-    async def connect(self) -> bool:
-        """Connect to the MCP server.
-
-        Returns:
-            True if connection successful
-        """
-        # TODO: Implement actual MCP connection
-        # For now, this is a placeholder
-        logger.info(f"MCP: Connecting to {self.server_url}")
-        return True
-
-    async def list_tools(self) -> list[dict[str, Any]]:
-        """List available tools from the MCP server.
-
-        Returns:
-            List of tool definitions
-        """
-        # TODO: Implement actual tools/list call
-        return self._tools
-
-    async def call_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
-        """Call a tool on the MCP server.
-
-        Args:
-            name: Tool name
-            arguments: Tool arguments
-
-        Returns:
-            Tool result
-        """
-        # TODO: Implement actual tool call
-        logger.info(f"MCP: Calling tool {name} with args {list(arguments.keys())}")
-        return {"output": f"MCP tool {name} called (placeholder)", "metadata": {}}
-
-    async def disconnect(self) -> None:
-        """Disconnect from the MCP server."""
-        logger.info(f"MCP: Disconnecting from {self.server_url}")
-
-
-def mcp_tool_to_wolo_tool(mcp_tool: dict[str, Any], server_name: str) -> dict[str, Any]:
-    """Convert an MCP tool definition to Wolo format.
-
-    Args:
-        mcp_tool: MCP tool definition
-        server_name: Name of the MCP server
-
-    Returns:
-        Wolo-compatible tool definition
-    """
-    name = mcp_tool.get("name", "")
-    description = mcp_tool.get("description", "")
-    input_schema = mcp_tool.get("inputSchema", {})
-
-    return {
-        "type": "function",
-        "function": {
-            "name": f"mcp_{server_name}_{name}",
-            "description": f"[MCP:{server_name}] {description}",
-            "parameters": input_schema,
-        },
-    }
-
-
-async def load_mcp_tools(servers: list[str]) -> list[dict[str, Any]]:
-    """Load tools from multiple MCP servers.
-
-    Args:
-        servers: List of MCP server URLs
-
-    Returns:
-        List of Wolo-compatible tool definitions
-    """
-    all_tools = []
-
-    for server_url in servers:
-        try:
-            client = MCPClient(server_url)
-            if await client.connect():
-                mcp_tools = await client.list_tools()
-
-                server_name = server_url.replace("://", "_").replace(".", "_").replace("/", "_")
-                for tool in mcp_tools:
-                    wolo_tool = mcp_tool_to_wolo_tool(tool, server_name)
-                    all_tools.append(wolo_tool)
-
-                await client.disconnect()
-
-        except Exception as e:
-            logger.warning(f"Failed to connect to MCP server {server_url}: {e}")
-
-    return all_tools
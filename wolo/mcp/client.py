@@ -11,6 +11,7 @@ Supports two transport types:
 
 import logging
 import os
+import sys
 from contextlib import AsyncExitStack
 from dataclasses import dataclass, field
 from typing import Any
@@ -20,9 +21,9 @@ from mcp.client.stdio import stdio_client
 from mcp.client.streamable_http import streamablehttp_client
 from mcp.types import Tool as MCPToolType
 
-try:
+if sys.version_info >= (3, 11):
     from builtins import BaseExceptionGroup
-except ImportError:
+else:
     from exceptiongroup import BaseExceptionGroup
 
 logger = logging.getLogger(__name__)
@@ -57,6 +58,8 @@ class MCPTool:
     name: str
     description: str
     input_schema: dict = field(default_factory=dict)
+    # Prefixed registry name ("mcp_<server>__<tool>"), set by MCPServerManager
+    full_name: str = ""
 
     def to_dict(self) -> dict:
         return {
@@ -9,9 +9,17 @@ and provide helpful installation instructions.
 import logging
 import shutil
 import subprocess
+import time
 
 logger = logging.getLogger(__name__)
 
+# How long a PATH probe for npx stays fresh (seconds). Status polling calls
+# check_npx_available() repeatedly; installing Node mid-session is rare.
+NPX_CHECK_TTL = 30.0
+
+# (checked_at, available) from the last npx probe
+_npx_cache: tuple[float, bool] | None = None
+
 
 def check_node_available() -> bool:
     """Check if Node.js is available."""
@@ -19,8 +27,22 @@ def check_node_available() -> bool:
 
 
 def check_npx_available() -> bool:
-    """Check if npx is available."""
-    return shutil.which("npx") is not None
+    """Check if npx is available (cached for NPX_CHECK_TTL seconds)."""
+    global _npx_cache
+
+    now = time.monotonic()
+    if _npx_cache is not None and now - _npx_cache[0] < NPX_CHECK_TTL:
+        return _npx_cache[1]
+
+    available = shutil.which("npx") is not None
+    _npx_cache = (now, available)
+    return available
+
+
+def clear_npx_cache() -> None:
+    """Forget the cached npx probe so the next check hits PATH again."""
+    global _npx_cache
+    _npx_cache = None
 
 
 def get_node_version() -> str | None:
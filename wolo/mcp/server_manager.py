@@ -13,6 +13,7 @@ Features:
 
 import asyncio
 import logging
+import sys
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
@@ -22,9 +23,9 @@ from ..claude.mcp_config import MCPServerConfig
 from .client import MCPClient, MCPError, MCPTool
 from .node_check import NodeNotAvailableError, check_npx_available
 
-try:
+if sys.version_info >= (3, 11):
     from builtins import BaseExceptionGroup
-except ImportError:
+else:
     from exceptiongroup import BaseExceptionGroup
 
 logger = logging.getLogger(__name__)
@@ -87,6 +88,10 @@ class MCPServerManager:
         self._servers: dict[str, ServerState] = {}
         self._node_available: bool | None = None
 
+        # Bumped whenever the set of available tools may have changed, so
+        # consumers can skip re-scanning get_all_tools() when nothing moved
+        self._tools_generation: int = 0
+
         # Background initialization state
         self._init_task: asyncio.Task | None = None
         self._init_started: bool = False
@@ -110,6 +115,7 @@ class MCPServerManager:
             config: Server configuration
         """
         self._servers[config.name] = ServerState(config=config)
+        self._tools_generation += 1
         logger.debug(f"Added MCP server: {config.name}")
 
     def add_servers(self, configs: dict[str, MCPServerConfig]) -> None:
@@ -195,11 +201,13 @@ class MCPServerManager:
 
             # Get tools
             tools = await client.list_tools()
+            self._assign_full_names(state.config.name, tools)
 
             state.client = client
             state.tools = tools
             state.status = ServerStatus.RUNNING
             state.error = None
+            self._tools_generation += 1
 
             logger.info(f"Started local MCP server {state.config.name}: {len(tools)} tools")
 
@@ -241,11 +249,13 @@ class MCPServerManager:
 
             # Get tools
             tools = await client.list_tools()
+            self._assign_full_names(state.config.name, tools)
 
             state.client = client
             state.tools = tools
             state.status = ServerStatus.RUNNING
             state.error = None
+            self._tools_generation += 1
 
             logger.info(f"Started remote MCP server {state.config.name}: {len(tools)} tools")
 
@@ -267,6 +277,12 @@ class MCPServerManager:
             logger.error(f"Failed to start remote server {state.config.name}: {e}")
             return False
 
+    @staticmethod
+    def _assign_full_names(server_name: str, tools: list[MCPTool]) -> None:
+        """Compute each tool's prefixed name once, when the server connects."""
+        for tool in tools:
+            tool.full_name = f"mcp_{server_name}__{tool.name}"
+
     async def _start_python_fallback(self, state: ServerState) -> bool:
         """Start a Python fallback server."""
         # TODO: Implement Python fallback servers
@@ -314,6 +330,7 @@ class MCPServerManager:
         state.client = None
         state.tools = []
         state.status = ServerStatus.STOPPED
+        self._tools_generation += 1
         logger.debug(f"Stopped MCP server: {name}")
 
     async def start_all(self) -> dict[str, bool]:
@@ -409,6 +426,11 @@ class MCPServerManager:
         """Check if initialization is complete."""
         return self._init_complete
 
+    @property
+    def tools_generation(self) -> int:
+        """Counter that changes whenever the set of available tools may have changed."""
+        return self._tools_generation
+
     async def stop_all(self) -> None:
         """Stop all servers."""
         tasks = [self.stop_server(name) for name in self._servers]
@@ -441,7 +463,7 @@ class MCPServerManager:
         """
         schemas = []
         for server_name, tool in self.get_all_tools():
-            name = f"mcp_{server_name}__{tool.name}" if prefix else tool.name
+            name = tool.full_name if prefix else tool.name
             schemas.append(
                 {
                     "type": "function",
@@ -7,7 +7,10 @@ This module provides the high-level integration between:
 - Tool registry
 """
 
+import asyncio
 import logging
+import sys
+import threading
 
 from .claude import ClaudeSkill, load_claude_mcp_servers
 from .claude.mcp_config import MCPServerConfig, merge_mcp_configs
@@ -26,9 +29,9 @@ from .mcp.cache import (
 )
 from .tool_registry import ToolCategory, ToolSpec, get_registry
 
-try:
+if sys.version_info >= (3, 11):
     from builtins import BaseExceptionGroup
-except ImportError:
+else:
     from exceptiongroup import BaseExceptionGroup
 
 logger = logging.getLogger(__name__)
@@ -39,6 +42,17 @@ _mcp_manager: MCPServerManager | None = None
 _skills: list[ClaudeSkill] = []  # Renamed from _claude_skills
 _mcp_cache: MCPCache | None = None  # MCP tools cache
 _using_cached_tools: bool = False  # Whether we're currently using cached tools
+_cache_dirty: bool = False  # Whether _mcp_cache has unsaved changes
+_cache_flush_task: asyncio.Task | None = None  # Pending debounced cache flush
+# Serializes off-loop cache writes. A thread lock held by the worker itself:
+# cancelling the awaiting task can't stop the thread, so the lock has to
+# stay held until the file is actually written
+_cache_save_lock = threading.Lock()
+
+# Delay before flushing cache updates from server connections (seconds).
+# Servers usually connect in a burst during background init; coalescing
+# their updates turns N cache writes into one.
+CACHE_FLUSH_DELAY = 0.5
 
 
 async def initialize_mcp(config: Config) -> MCPServerManager:
@@ -60,7 +74,7 @@ async def initialize_mcp(config: Config) -> MCPServerManager:
     Returns:
         MCPServerManager instance
     """
-    global _mcp_manager, _mcp_cache, _using_cached_tools
+    global _mcp_manager, _mcp_cache, _using_cached_tools, _last_registered_generation
 
     # Determine node strategy
     node_strategy = config.mcp.node_strategy
@@ -69,6 +83,9 @@ async def initialize_mcp(config: Config) -> MCPServerManager:
 
     # Create server manager
     _mcp_manager = MCPServerManager(node_strategy=node_strategy)
+    # A new manager counts generations from 0 again, so the last one's
+    # number says nothing about which of its tools are registered
+    _last_registered_generation = None
 
     # Load Claude MCP configuration
     claude_servers: dict[str, MCPServerConfig] = {}
@@ -181,7 +198,10 @@ async def initialize_mcp_blocking(config: Config) -> MCPServerManager:
     return manager
 
 
+# Registered names are interned so the set, the registry and repeated
+# lookups share one string object per tool.
 _registered_mcp_tools: set[str] = set()
+_last_registered_generation: int | None = None  # Manager tools_generation at last register
 
 
 def _register_cached_tools() -> None:
@@ -213,6 +233,7 @@ def _register_cached_tools() -> None:
                 parameters = tool.get("input_schema", tool.get("inputSchema", {}))
 
             # Skip if already registered
+            tool_name = sys.intern(tool_name)
             if tool_name in _registered_mcp_tools:
                 continue
 
@@ -246,25 +267,76 @@ async def _on_server_connected(server_name: str, tools: list) -> None:
     logger.info(f"MCP server connected: {server_name} ({len(tools)} tools)")
 
     # Update cache with fresh tool data
-    tool_schemas = []
-    for tool in tools:
-        tool_schemas.append(
-            {
-                "name": tool.name,
-                "description": tool.description,
-                "input_schema": tool.input_schema,
-            }
-        )
+    tool_schemas = [
+        {"name": t.name, "description": t.description, "input_schema": t.input_schema}
+        for t in tools
+    ]
 
     _mcp_cache = update_server_cache(_mcp_cache, server_name, tool_schemas, "running")
 
-    # Save updated cache
-    save_cache(_mcp_cache)
+    # Schedule a debounced save instead of writing once per server
+    _schedule_cache_flush()
 
     # Register new tools (idempotent)
     _register_mcp_tools()
 
 
+def _schedule_cache_flush() -> None:
+    """Mark the cache dirty and schedule a single delayed flush if none is pending."""
+    global _cache_dirty, _cache_flush_task
+
+    _cache_dirty = True
+    if _cache_flush_task is None or _cache_flush_task.done():
+        _cache_flush_task = asyncio.create_task(_delayed_cache_flush(CACHE_FLUSH_DELAY))
+
+
+async def _delayed_cache_flush(delay: float) -> None:
+    """Wait for further updates to accumulate, then save the cache once."""
+    global _cache_dirty
+
+    await asyncio.sleep(delay)
+    if _cache_dirty and _mcp_cache:
+        _cache_dirty = False
+        await _save_cache_async(_mcp_cache)
+
+
+async def _save_cache_async(cache: MCPCache) -> None:
+    """
+    Save the cache from a worker thread so disk I/O doesn't block the event loop.
+
+    Writes are serialized with a lock taken in the worker thread, so only
+    one thread touches the cache file at a time even if the task awaiting
+    an earlier write was cancelled. A shallow snapshot is written so
+    callbacks can keep updating the live cache while the write is in flight.
+
+    Args:
+        cache: Cache to save
+    """
+    snapshot = MCPCache(
+        version=cache.version,
+        updated_at=cache.updated_at,
+        servers=dict(cache.servers),
+    )
+    await asyncio.to_thread(_save_cache_locked, snapshot)
+    cache.updated_at = snapshot.updated_at
+
+
+def _save_cache_locked(cache: MCPCache) -> None:
+    """Write the cache while holding the save lock (runs in a worker thread)."""
+    with _cache_save_lock:
+        save_cache(cache)
+
+
+def _cancel_cache_flush() -> None:
+    """Cancel any pending debounced flush (caller is about to save explicitly)."""
+    global _cache_dirty, _cache_flush_task
+
+    if _cache_flush_task is not None and not _cache_flush_task.done():
+        _cache_flush_task.cancel()
+    _cache_flush_task = None
+    _cache_dirty = False
+
+
 async def _on_init_complete() -> None:
     """
     Callback when MCP initialization completes.
@@ -286,17 +358,14 @@ async def _on_init_complete() -> None:
         server_states[server_name] = {
             "status": state.status.value,
             "tools": [
-                {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "input_schema": tool.input_schema,
-                }
-                for tool in state.tools
+                {"name": t.name, "description": t.description, "input_schema": t.input_schema}
+                for t in state.tools
             ],
         }
 
     _mcp_cache = rebuild_cache_from_servers(_mcp_cache, server_states)
-    save_cache(_mcp_cache)
+    _cancel_cache_flush()
+    await _save_cache_async(_mcp_cache)
     logger.debug(f"Cache rebuilt with {len(_mcp_cache.servers)} connected servers")
 
 
@@ -307,16 +376,21 @@ def _register_mcp_tools() -> None:
     This is idempotent - calling it multiple times will only register
     new tools that haven't been registered yet.
     """
-    global _registered_mcp_tools
+    global _registered_mcp_tools, _last_registered_generation
 
     if not _mcp_manager:
         return
 
+    # Nothing connected or disconnected since the last pass
+    generation = _mcp_manager.tools_generation
+    if generation == _last_registered_generation:
+        return
+
     registry = get_registry()
 
     # Register tools from MCP servers
     for server_name, tool in _mcp_manager.get_all_tools():
-        tool_name = f"mcp_{server_name}__{tool.name}"
+        tool_name = sys.intern(tool.full_name)
 
         # Skip if already registered
         if tool_name in _registered_mcp_tools:
@@ -336,6 +410,8 @@ def _register_mcp_tools() -> None:
         _registered_mcp_tools.add(tool_name)
         logger.debug(f"Registered MCP tool: {tool_name}")
 
+    _last_registered_generation = generation
+
 
 async def call_mcp_tool(tool_name: str, arguments: dict) -> dict:
     """
@@ -401,11 +477,12 @@ def find_matching_skill(query: str) -> ClaudeSkill | None:
 
 async def shutdown_mcp() -> None:
     """Shutdown MCP integration."""
-    global _mcp_manager, _mcp_cache
+    global _mcp_manager, _mcp_cache, _last_registered_generation
 
     # Save cache before shutdown (contains latest tool info)
+    _cancel_cache_flush()
     if _mcp_cache:
-        save_cache(_mcp_cache)
+        await _save_cache_async(_mcp_cache)
         logger.debug("Saved MCP cache before shutdown")
 
     # Stop MCP servers
@@ -436,6 +513,7 @@ async def shutdown_mcp() -> None:
                 logger.warning(f"Error during MCP shutdown: {e}")
         finally:
             _mcp_manager = None
+            _last_registered_generation = None
 
     logger.info("MCP integration shutdown complete")
 
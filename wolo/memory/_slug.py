@@ -0,0 +1,34 @@
+"""Filename slug helper shared by the memory models."""
+
+import re
+import uuid
+
+# Characters str.isspace() (and so regex \s) treats as whitespace
+_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
+# Filesystem-unsafe characters and whitespace, each mapped to a dash
+_SLUG_TRANS = str.maketrans(dict.fromkeys('/\\:*?"<>|.' + _WHITESPACE, "-"))
+_SLUG_COLLAPSE_RE = re.compile(r"-{2,}")
+
+
+def slugify(text: str, max_len: int = 30) -> str:
+    """Convert text to a filesystem-safe slug.
+
+    Examples:
+        "处理XML报表流程" -> "处理XML报表流程"
+        "Debug async code" -> "debug-async-code"
+        "a/b:c?d" -> "a-b-c-d"
+    """
+    # Replace filesystem-unsafe chars with dash (a C-level table lookup)
+    slug = text.strip().translate(_SLUG_TRANS)
+    # Collapse runs of dashes
+    slug = _SLUG_COLLAPSE_RE.sub("-", slug)
+    # Strip leading/trailing dashes
+    slug = slug.strip("-")
+    # Truncate
+    if len(slug) > max_len:
+        slug = slug[:max_len].rstrip("-")
+    return slug or uuid.uuid4().hex[:8]
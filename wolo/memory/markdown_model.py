@@ -20,37 +20,50 @@ source_session: AgentName_260212_103000
 ```
 """
 
+import logging
+import os
 import re
-import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 
+from wolo.memory._slug import slugify as _slugify
 
-def _slugify(text: str, max_len: int = 30) -> str:
-    """Convert text to a filesystem-safe slug.
+logger = logging.getLogger(__name__)
 
-    Examples:
-        "处理XML报表流程" -> "处理XML报表流程"
-        "Debug async code" -> "debug-async-code"
-        "a/b:c?d" -> "a-b-c-d"
-    """
-    # Replace filesystem-unsafe chars with dash
-    slug = re.sub(r'[/\\:*?"<>|.\s]+', "-", text.strip())
-    # Collapse multiple dashes
-    slug = re.sub(r"-{2,}", "-", slug)
-    # Strip leading/trailing dashes
-    slug = slug.strip("-")
-    # Truncate
-    if len(slug) > max_len:
-        slug = slug[:max_len].rstrip("-")
-    return slug or uuid.uuid4().hex[:8]
-
-
-@dataclass
+# One "key: value" line of frontmatter
+_FM_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*:[ \t]*(.*?)[ \t\r]*$", re.M)
+
+# Bytes read up front by from_file(); enough for any realistic frontmatter
+_HEAD_READ_SIZE = 4096
+
+
+# Fields compared by __eq__ and shown by __repr__, content included
+_PUBLIC_FIELDS = (
+    "file_path",
+    "title",
+    "tags",
+    "created_at",
+    "updated_at",
+    "source_session",
+    "content",
+)
+
+
+def _normalize_newlines(text: str) -> str:
+    """Convert CRLF/CR line endings to LF, matching read_text() semantics."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+@dataclass(slots=True, init=False, repr=False, eq=False)
 class MarkdownMemory:
     """A memory entry stored as markdown with YAML frontmatter.
 
+    The body of a file-backed memory is loaded on first access to content,
+    so __init__, __repr__ and __eq__ are written out to go through it.
+
     Attributes:
         file_path: Path to the markdown file
         title: Short descriptive title
@@ -67,13 +80,109 @@ class MarkdownMemory:
     created_at: datetime
     updated_at: datetime
     source_session: str | None = None
-    content: str = ""
+
+    # Markdown body; None until first read when loaded lazily by from_file()
+    _body: str | None = field(default=None, repr=False, compare=False)
+    # Byte offset of the body in file_path, used to load a deferred body
+    _body_offset: int = field(default=0, repr=False, compare=False)
+    # (st_mtime_ns, st_size) of file_path when it was loaded; the offset is
+    # only trusted while the file still matches
+    _source_stat: tuple[int, int] | None = field(default=None, repr=False, compare=False)
+
+    # Lazily computed lower-cased search text: "title\0tag\0tag..." and content
+    _search_header: str | None = field(default=None, repr=False, compare=False)
+    _content_lower: str | None = field(default=None, repr=False, compare=False)
+
+    def __init__(
+        self,
+        file_path: Path,
+        title: str,
+        tags: list[str],
+        created_at: datetime,
+        updated_at: datetime,
+        source_session: str | None = None,
+        content: str = "",
+    ) -> None:
+        self.file_path = file_path
+        self.title = title
+        self.tags = tags
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.source_session = source_session
+        self._body = content
+        self._body_offset = 0
+        self._source_stat = None
+        self._search_header = None
+        self._content_lower = None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MarkdownMemory):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _PUBLIC_FIELDS)
+
+    def __repr__(self) -> str:
+        parts = ", ".join(f"{name}={getattr(self, name)!r}" for name in _PUBLIC_FIELDS)
+        return f"{type(self).__name__}({parts})"
+
+    @property
+    def content(self) -> str:
+        """Markdown content, loaded from disk on first access for file-backed memories."""
+        if self._body is None:
+            self._body = self._read_deferred_body()
+        return self._body
+
+    @content.setter
+    def content(self, value: str) -> None:
+        self._body = value
+        self._content_lower = None
+
+    def _read_deferred_body(self) -> str:
+        """Read the body from disk, re-parsing the file if it changed since loading.
+
+        Returns:
+            The body, or an empty string if the file is gone or no longer
+            a valid memory
+        """
+        try:
+            with open(self.file_path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if (st.st_mtime_ns, st.st_size) == self._source_stat:
+                    f.seek(self._body_offset)
+                    raw = f.read()
+                    # The byte after the closing "---" is its line break (same
+                    # as the eager path, which skips one character before stripping)
+                    return _normalize_newlines(raw.decode("utf-8"))[1:].strip()
+            # Edited since loading: the recorded offset may now point into
+            # the frontmatter, so parse the file again
+            return type(self).from_file(self.file_path).content
+        except (OSError, ValueError) as e:
+            logger.warning(f"Failed to load memory body {self.file_path}: {e}")
+            return ""
 
     @property
     def id(self) -> str:
         """Memory ID derived from filename."""
         return self.file_path.stem
 
+    @property
+    def search_header(self) -> str:
+        """Lower-cased title and tags joined by NUL, computed once per instance.
+
+        NUL never appears in a query, so a substring match can't straddle
+        two fields. Memories loaded by storage are not mutated in place;
+        save() drops the cached value in case a caller edits fields first.
+        """
+        if self._search_header is None:
+            self._search_header = "\0".join([self.title, *self.tags]).lower()
+        return self._search_header
+
+    @property
+    def content_lower(self) -> str:
+        """Lower-cased content, computed (and the body loaded) on first use."""
+        if self._content_lower is None:
+            self._content_lower = self.content.lower()
+        return self._content_lower
+
     @classmethod
     def from_file(cls, path: Path) -> "MarkdownMemory":
         """Load a memory from a markdown file.
@@ -87,89 +196,103 @@ class MarkdownMemory:
         Raises:
             ValueError: If file format is invalid
         """
-        content = path.read_text(encoding="utf-8")
+        # Only the head of the file is needed for the frontmatter; the body
+        # is read on first access to .content unless it came along already
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        try:
+            st = os.fstat(fd)
+            head = os.read(fd, _HEAD_READ_SIZE)
+            complete = len(head) < _HEAD_READ_SIZE
+            fm_end = _find_frontmatter_end(head)
+            if fm_end == -1 and not complete:
+                # Oversized frontmatter: fall back to the whole file
+                head += _read_rest(fd)
+                complete = True
+                fm_end = _find_frontmatter_end(head)
+        finally:
+            os.close(fd)
 
         # Parse YAML frontmatter
-        if not content.startswith("---"):
+        if not head.startswith(b"---"):
             raise ValueError(f"Memory file {path} missing YAML frontmatter")
 
         # Find end of frontmatter
-        fm_end = content.find("\n---", 4)
         if fm_end == -1:
             raise ValueError(f"Memory file {path} has malformed frontmatter")
 
-        frontmatter = content[4:fm_end]
-        body = content[fm_end + 5 :].strip()
+        frontmatter = _normalize_newlines(head[4:fm_end].decode("utf-8"))
+        body_offset = fm_end + 4
+        body = None
+        if complete:
+            body = _normalize_newlines(head[body_offset:].decode("utf-8"))[1:].strip()
 
         # Parse frontmatter (simple YAML-like parsing)
         metadata = {}
-        for line in frontmatter.split("\n"):
-            if ":" in line:
-                key, value = line.split(":", 1)
-                key = key.strip()
-                value = value.strip()
-
-                # Parse tags list
-                if key == "tags":
-                    if value.startswith("[") and value.endswith("]"):
-                        tags_str = value[1:-1]
-                        metadata["tags"] = [
-                            t.strip().strip('"').strip("'")
-                            for t in tags_str.split(",")
-                            if t.strip()
-                        ]
-                    else:
-                        metadata["tags"] = []
-                elif key in ("created_at", "updated_at"):
-                    # Parse ISO format datetime
-                    try:
-                        metadata[key] = datetime.fromisoformat(value)
-                    except ValueError:
-                        metadata[key] = datetime.now()
-                elif key == "source_session":
-                    metadata[key] = value if value and value != "null" else None
+        for key, value in _FM_LINE_RE.findall(frontmatter):
+            # Parse tags list
+            if key == "tags":
+                if value.startswith("[") and value.endswith("]"):
+                    tags_str = value[1:-1]
+                    metadata["tags"] = [
+                        t.strip().strip('"').strip("'") for t in tags_str.split(",") if t.strip()
+                    ]
                 else:
-                    metadata[key] = value
-
-        return cls(
+                    metadata["tags"] = []
+            elif key in ("created_at", "updated_at"):
+                # Parse ISO format datetime
+                try:
+                    metadata[key] = datetime.fromisoformat(value)
+                except ValueError:
+                    metadata[key] = datetime.now()
+            elif key == "source_session":
+                metadata[key] = value if value and value != "null" else None
+            else:
+                metadata[key] = value
+
+        memory = cls(
             file_path=path,
             title=metadata.get("title", path.stem),
             tags=metadata.get("tags", []),
-            created_at=metadata.get("created_at", datetime.now()),
-            updated_at=metadata.get("updated_at", datetime.now()),
+            # `or` defers the clock read to files that lack a timestamp
+            created_at=metadata.get("created_at") or datetime.now(),
+            updated_at=metadata.get("updated_at") or datetime.now(),
             source_session=metadata.get("source_session"),
-            content=body,
         )
+        memory._body = body
+        memory._body_offset = body_offset
+        memory._source_stat = (st.st_mtime_ns, st.st_size)
+        return memory
 
     def to_markdown(self) -> str:
         """Convert memory to markdown format with YAML frontmatter."""
-        # Build frontmatter
-        lines = ["---"]
-        lines.append(f"title: {self.title}")
-
-        # Format tags
-        if self.tags:
-            tags_str = ", ".join(self.tags)
-            lines.append(f"tags: [{tags_str}]")
-        else:
-            lines.append("tags: []")
-
-        lines.append(f"created_at: {self.created_at.isoformat()}")
-        lines.append(f"updated_at: {self.updated_at.isoformat()}")
-
+        frontmatter = (
+            f"---\n"
+            f"title: {self.title}\n"
+            f"tags: [{', '.join(self.tags)}]\n"
+            f"created_at: {self.created_at.isoformat()}\n"
+            f"updated_at: {self.updated_at.isoformat()}\n"
+        )
         if self.source_session:
-            lines.append(f"source_session: {self.source_session}")
+            frontmatter += f"source_session: {self.source_session}\n"
 
-        lines.append("---")
-        lines.append("")
-        lines.append(self.content)
+        return f"{frontmatter}---\n\n{self.content}"
 
-        return "\n".join(lines)
+    def save(self) -> float:
+        """Save memory to its file path.
 
-    def save(self) -> None:
-        """Save memory to its file path."""
+        Returns:
+            Modification time of the written file, taken from the open
+            handle so callers don't need a separate stat()
+        """
+        # Render first: a deferred body is read from the file being replaced
+        text = self.to_markdown()
+        self._search_header = None
+        self._content_lower = None
         self.file_path.parent.mkdir(parents=True, exist_ok=True)
-        self.file_path.write_text(self.to_markdown(), encoding="utf-8")
+        with open(self.file_path, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            return os.fstat(f.fileno()).st_mtime
 
     @classmethod
     def create(
@@ -213,3 +336,21 @@ class MarkdownMemory:
             source_session=source_session,
             content=content,
         )
+
+
+def _find_frontmatter_end(head: bytes) -> int:
+    """Find the offset of the newline before the closing "---", or -1.
+
+    CRs are mapped to LFs one-for-one, so offsets stay valid for the raw bytes.
+    """
+    if b"\r" in head:
+        head = head.replace(b"\r", b"\n")
+    return head.find(b"\n---", 4)
+
+
+def _read_rest(fd: int) -> bytes:
+    """Read from fd until EOF."""
+    chunks = []
+    while chunk := os.read(fd, 65536):
+        chunks.append(chunk)
+    return b"".join(chunks)
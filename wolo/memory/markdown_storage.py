@@ -4,7 +4,11 @@ Provides efficient scanning of memory files with caching to avoid
 re-reading unchanged files.
 """
 
+import bisect
 import logging
+import os
+from collections.abc import Iterator
+from datetime import datetime
 from pathlib import Path
 
 from wolo.memory.markdown_model import MarkdownMemory
@@ -28,51 +32,109 @@ class MarkdownMemoryStorage:
         self.base_dir = base_dir
         self.base_dir.mkdir(parents=True, exist_ok=True)
 
-        # Cache: file_path -> (mtime, memory)
-        self._cache: dict[Path, tuple[float, MarkdownMemory]] = {}
+        # Cache: str(file_path) -> (mtime, memory)
+        # Keyed by path string to avoid hashing Path objects on every probe
+        self._cache: dict[str, tuple[float, MarkdownMemory]] = {}
+        # (created_at, key) for every cached memory, kept in ascending order
+        # so scans don't re-sort memories that haven't changed
+        self._sorted: list[tuple[datetime, str]] = []
+        # Bumped by every create/delete made through this storage
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        """Counter that changes whenever this storage writes or deletes a memory."""
+        return self._version
+
+    def _cache_put(self, key: str, mtime: float, memory: MarkdownMemory) -> None:
+        """Add or replace a cache entry, keeping the sorted index in step."""
+        self._cache_drop(key)
+        self._cache[key] = (mtime, memory)
+        bisect.insort(self._sorted, (memory.created_at, key))
+
+    def _cache_drop(self, key: str) -> None:
+        """Remove a cache entry (if any) and its sorted index slot."""
+        cached = self._cache.pop(key, None)
+        if cached is not None:
+            entry = (cached[1].created_at, key)
+            i = bisect.bisect_left(self._sorted, entry)
+            if i < len(self._sorted) and self._sorted[i] == entry:
+                del self._sorted[i]
+            else:
+                # created_at was edited in place after caching
+                self._sorted = [item for item in self._sorted if item[1] != key]
+
+    def _path_for_id(self, memory_id: str) -> Path:
+        """Get the file path for a memory ID (filename without extension)."""
+        return self.base_dir / f"{memory_id}.md"
+
+    def _iter_md_entries(self) -> Iterator[os.DirEntry]:
+        """Yield directory entries for memory files in base_dir.
+
+        Uses os.scandir so each entry's stat result is cached on the
+        DirEntry instead of being re-fetched through pathlib.
+        """
+        try:
+            with os.scandir(self.base_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".md") and entry.is_file(follow_symlinks=False):
+                        yield entry
+        except FileNotFoundError:
+            return
 
-    def scan_memories(self, force: bool = False) -> list[MarkdownMemory]:
-        """Scan directory for memory files, using cache for unchanged files.
+    def _refresh(self, force: bool = False) -> None:
+        """Bring the cache in line with the memory files in base_dir.
+
+        Unchanged files are kept as-is; new or modified files are loaded,
+        and entries for deleted or unreadable files are dropped.
 
         Args:
             force: If True, ignore cache and re-read all files
-
-        Returns:
-            List of MarkdownMemory objects, sorted by created_at (newest first)
         """
-        memories = []
+        cache = self._cache
+        seen: set[str] = set()
 
-        # Get all existing memory files
-        existing_paths = set(self.base_dir.glob("*.md"))
-
-        # Clean up cache entries for deleted files
-        cached_paths = set(self._cache.keys())
-        deleted_paths = cached_paths - existing_paths
-        for deleted_path in deleted_paths:
-            del self._cache[deleted_path]
-            logger.debug(f"Removed deleted file from cache: {deleted_path}")
-
-        for path in existing_paths:
+        for entry in self._iter_md_entries():
+            key = entry.path
+            seen.add(key)
             try:
                 # Check cache
-                mtime = path.stat().st_mtime
-                if not force and path in self._cache:
-                    cached_mtime, cached_memory = self._cache[path]
-                    if cached_mtime == mtime:
-                        memories.append(cached_memory)
+                mtime = entry.stat().st_mtime
+                if not force:
+                    cached = cache.get(key)
+                    if cached is not None and cached[0] == mtime:
                         continue
 
                 # Read file
-                memory = MarkdownMemory.from_file(path)
-                self._cache[path] = (mtime, memory)
-                memories.append(memory)
+                memory = MarkdownMemory.from_file(Path(key))
+                self._cache_put(key, mtime, memory)
 
             except Exception as e:
-                logger.warning(f"Failed to load memory {path}: {e}")
+                logger.warning(f"Failed to load memory {key}: {e}")
+                self._cache_drop(key)
+
+        # Clean up cache entries for deleted files
+        for deleted_path in [key for key in cache if key not in seen]:
+            self._cache_drop(deleted_path)
+            logger.debug(f"Removed deleted file from cache: {deleted_path}")
 
-        # Sort by created_at descending
-        memories.sort(key=lambda m: m.created_at, reverse=True)
-        return memories
+    def _iter_newest_first(self) -> Iterator[MarkdownMemory]:
+        """Yield cached memories ordered by created_at (newest first)."""
+        cache = self._cache
+        for _, key in reversed(self._sorted):
+            yield cache[key][1]
+
+    def scan_memories(self, force: bool = False) -> list[MarkdownMemory]:
+        """Scan directory for memory files, using cache for unchanged files.
+
+        Args:
+            force: If True, ignore cache and re-read all files
+
+        Returns:
+            List of MarkdownMemory objects, sorted by created_at (newest first)
+        """
+        self._refresh(force)
+        return list(self._iter_newest_first())
 
     def create_memory(
         self,
@@ -102,11 +164,11 @@ class MarkdownMemoryStorage:
             source_session=source_session,
             max_content_size=max_content_size,
         )
-        memory.save()
+        mtime = memory.save()
 
         # Update cache
-        mtime = memory.file_path.stat().st_mtime
-        self._cache[memory.file_path] = (mtime, memory)
+        self._cache_put(str(memory.file_path), mtime, memory)
+        self._version += 1
 
         logger.debug(f"Created memory: {memory.id}")
         return memory
@@ -120,21 +182,28 @@ class MarkdownMemoryStorage:
         Returns:
             MarkdownMemory or None if not found
         """
-        # Try to find in cache first
-        for path, (_, memory) in self._cache.items():
-            if memory.id == memory_id:
-                return memory
-
-        # Search in filesystem
-        for path in self.base_dir.glob("*.md"):
-            if path.stem == memory_id:
-                try:
-                    memory = MarkdownMemory.from_file(path)
-                    mtime = path.stat().st_mtime
-                    self._cache[path] = (mtime, memory)
-                    return memory
-                except Exception as e:
-                    logger.warning(f"Failed to load memory {path}: {e}")
+        # Memory IDs are file stems, so the cache key and file path follow
+        # directly from the ID; no need to scan the cache or the directory.
+        if not memory_id or os.path.basename(memory_id) != memory_id:
+            return None
+        path = self._path_for_id(memory_id)
+        key = str(path)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached[1]
+
+        try:
+            mtime = os.stat(key).st_mtime
+        except OSError:
+            return None
+
+        try:
+            memory = MarkdownMemory.from_file(path)
+            self._cache_put(key, mtime, memory)
+            return memory
+        except Exception as e:
+            logger.warning(f"Failed to load memory {path}: {e}")
 
         return None
 
@@ -147,15 +216,22 @@ class MarkdownMemoryStorage:
         Returns:
             True if deleted, False if not found
         """
-        for path in self.base_dir.glob("*.md"):
-            if path.stem == memory_id:
-                path.unlink()
-                # Remove from cache
-                if path in self._cache:
-                    del self._cache[path]
-                logger.debug(f"Deleted memory: {memory_id}")
-                return True
-        return False
+        # The path follows from the ID, so unlink it directly instead of
+        # globbing the directory for a matching stem
+        if not memory_id or os.path.basename(memory_id) != memory_id:
+            return False
+        key = str(self._path_for_id(memory_id))
+
+        # Remove from cache (a stale entry goes even if the file is gone)
+        self._cache_drop(key)
+        try:
+            os.unlink(key)
+        except FileNotFoundError:
+            return False
+
+        self._version += 1
+        logger.debug(f"Deleted memory: {memory_id}")
+        return True
 
     def search(self, query: str) -> list[MarkdownMemory]:
         """Search memories by query.
@@ -166,32 +242,24 @@ class MarkdownMemoryStorage:
             query: Search query string
 
         Returns:
-            List of matching memories
+            List of matching memories, sorted by created_at (newest first)
         """
         query_lower = query.lower()
         results = []
 
-        for memory in self.scan_memories():
-            # Search in title
-            if query_lower in memory.title.lower():
-                results.append(memory)
-                continue
-
-            # Search in tags
-            if any(query_lower in tag.lower() for tag in memory.tags):
-                results.append(memory)
-                continue
-
-            # Search in content
-            if query_lower in memory.content.lower():
+        self._refresh()
+        # Walking the sorted index keeps matches newest first without a sort
+        for memory in self._iter_newest_first():
+            # Title and tags first; the body is only loaded when they don't match
+            if query_lower in memory.search_header or query_lower in memory.content_lower:
                 results.append(memory)
-                continue
 
         return results
 
     def clear_cache(self) -> None:
         """Clear the memory cache."""
         self._cache.clear()
+        self._sorted.clear()
 
 
 # Global storage instance
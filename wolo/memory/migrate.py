@@ -12,6 +12,7 @@ Usage:
 
 import json
 import logging
+import os
 from datetime import datetime
 from pathlib import Path
 
@@ -46,14 +47,18 @@ def migrate_json_to_markdown(
     migrated = 0
     errors = 0
 
-    for json_file in old_dir.glob("*.json"):
-        # Skip index files
-        if json_file.name == "index.json":
-            continue
+    with os.scandir(old_dir) as entries:
+        json_files = [
+            Path(entry.path)
+            for entry in entries
+            # Skip index files
+            if entry.name.endswith(".json") and entry.name != "index.json"
+        ]
 
+    for json_file in json_files:
         try:
-            with open(json_file) as f:
-                data = json.load(f)
+            # Small files: read whole bytes and parse, skipping the text wrapper
+            data = json.loads(json_file.read_bytes())
 
             # Validate required fields
             if not all(k in data for k in ("id", "title", "content")):
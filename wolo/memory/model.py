@@ -1,32 +1,12 @@
 """Memory data model for Wolo long-term memory."""
 
-import re
-import uuid
 from dataclasses import dataclass
 from datetime import datetime
 
+from wolo.memory._slug import slugify as _slugify
 
-def _slugify(text: str, max_len: int = 30) -> str:
-    """Convert text to a filesystem-safe slug.
 
-    Examples:
-        "处理XML报表流程" -> "处理XML报表流程"
-        "Debug async code" -> "debug-async-code"
-        "a/b:c?d" -> "a-b-c-d"
-    """
-    # Replace filesystem-unsafe chars with dash
-    slug = re.sub(r'[/\\:*?"<>|.\s]+', "-", text.strip())
-    # Collapse multiple dashes
-    slug = re.sub(r"-{2,}", "-", slug)
-    # Strip leading/trailing dashes
-    slug = slug.strip("-")
-    # Truncate
-    if len(slug) > max_len:
-        slug = slug[:max_len].rstrip("-")
-    return slug or uuid.uuid4().hex[:8]
-
-
-@dataclass
+@dataclass(slots=True)
 class Memory:
     """A memory entry for long-term knowledge storage.
 
@@ -3,9 +3,12 @@
 Scans memory files and formats them as context for the LLM.
 """
 
+import io
 import logging
+import time
 from pathlib import Path
 
+from wolo.memory.markdown_model import MarkdownMemory
 from wolo.memory.markdown_storage import MarkdownMemoryStorage, get_markdown_storage
 
 logger = logging.getLogger(__name__)
@@ -20,6 +23,7 @@ class MemoryScanner:
     """
 
     MAX_MEMORY_CHARS = 50000  # Maximum total characters for memory context
+    PROBE_TTL = 0.25  # Seconds a cached context is served without re-probing the directory
 
     def __init__(self, storage: MarkdownMemoryStorage):
         """Initialize scanner.
@@ -31,18 +35,36 @@ class MemoryScanner:
         self._last_scan_count = 0
         # Cache for formatted context string
         self._cached_context: str | None = None
-        self._cache_dir_mtime: float = 0.0
-
-    def _get_dir_mtime(self) -> float:
-        """Get the most recent modification time in the memories directory.
-
-        Returns 0 if directory is empty or doesn't exist.
+        # (storage version, newest mtime, file count) the context was built for
+        self._cache_key: tuple[int, float, int] | None = None
+        # time.monotonic() of the last directory probe
+        self._last_probe_monotonic: float = 0.0
+        # memory id -> (memory, formatted block). Storage swaps in a new
+        # MarkdownMemory when a file changes, so identity marks a stale block
+        self._block_cache: dict[str, tuple[MarkdownMemory, str]] = {}
+
+    def _probe_dir(self) -> tuple[float, int]:
+        """Get the newest modification time and the number of memory files.
+
+        Returns (0.0, 0) if the directory is empty or doesn't exist.
         """
+        # One scandir pass; DirEntry caches its stat result, so each file
+        # costs at most one stat() and no Path allocation
+        latest = 0.0
+        count = 0
         try:
-            mtimes = [p.stat().st_mtime for p in self.storage.base_dir.glob("*.md") if p.is_file()]
-            return max(mtimes) if mtimes else 0.0
+            for entry in self.storage._iter_md_entries():
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    # Deleted since scandir listed it; the rest still count
+                    continue
+                count += 1
+                if mtime > latest:
+                    latest = mtime
         except OSError:
-            return 0.0
+            return 0.0, 0
+        return latest, count
 
     def scan_and_format(self) -> str | None:
         """Scan memories and format as LLM context string.
@@ -52,88 +74,119 @@ class MemoryScanner:
         Returns:
             Formatted memory context string, or None if no memories
         """
-        # Check if cache is still valid
-        current_mtime = self._get_dir_mtime()
-        if self._cached_context is not None and current_mtime == self._cache_dir_mtime:
+        # Back-to-back calls within PROBE_TTL reuse the context unprobed,
+        # unless this process has written to storage since
+        now = time.monotonic()
+        if (
+            self._cached_context is not None
+            and now - self._last_probe_monotonic < self.PROBE_TTL
+            and self._cache_key is not None
+            and self._cache_key[0] == self.storage.version
+        ):
+            return self._cached_context
+
+        # Check if cache is still valid. The storage version catches
+        # in-process writes regardless of mtime granularity; the file count
+        # catches deletions that leave the newest mtime unchanged
+        current_mtime, file_count = self._probe_dir()
+        cache_key = (self.storage.version, current_mtime, file_count)
+        self._last_probe_monotonic = now
+        if self._cached_context is not None and cache_key == self._cache_key:
             logger.debug("Memory context: using cached result")
             return self._cached_context if self._cached_context else None
 
+        # No memory files: skip the storage scan (a second directory walk)
+        if file_count == 0:
+            self._last_scan_count = 0
+            self._cached_context = None
+            self._cache_key = None
+            return None
+
         # Cache miss or invalidated - rebuild
         memories = self.storage.scan_memories()
         self._last_scan_count = len(memories)
 
         if not memories:
             self._cached_context = None
-            self._cache_dir_mtime = current_mtime
+            self._cache_key = cache_key
             return None
 
-        # Build context string
-        lines = [
-            "# Long-Term Memory",
-            "",
-            "The following memories have been saved from previous conversations.",
-            "Use this context to maintain continuity across sessions.",
-            "",
-        ]
+        # Build context string in one buffer; each memory block is preceded
+        # by a newline
+        buf = io.StringIO()
+        buf.write(
+            "# Long-Term Memory\n"
+            "\n"
+            "The following memories have been saved from previous conversations.\n"
+            "Use this context to maintain continuity across sessions.\n"
+        )
 
         total_chars = 0
         included_count = 0
 
+        block_cache: dict[str, tuple[MarkdownMemory, str]] = {}
+
         for memory in memories:
-            # Format each memory
-            memory_block = self._format_memory(memory)
+            # Reuse the formatted block unless the memory was reloaded
+            cached = self._block_cache.get(memory.id)
+            if cached is not None and cached[0] is memory:
+                block = cached[1]
+            else:
+                block = self._format_memory(memory)
+            block_cache[memory.id] = (memory, block)
+            block_len = len(block)
 
             # Check character limit
-            if total_chars + len(memory_block) > self.MAX_MEMORY_CHARS:
+            if total_chars + block_len > self.MAX_MEMORY_CHARS:
                 # Truncate this memory or skip
                 remaining = self.MAX_MEMORY_CHARS - total_chars
                 if remaining > 200:  # Only include if meaningful space left
-                    memory_block = memory_block[:remaining] + "\n...[truncated]"
-                    lines.append(memory_block)
+                    buf.write("\n")
+                    buf.write(block[:remaining])
+                    buf.write("\n...[truncated]")
                     included_count += 1
                 break
 
-            lines.append(memory_block)
-            total_chars += len(memory_block)
+            buf.write("\n")
+            buf.write(block)
+            total_chars += block_len
             included_count += 1
 
+        # Keep blocks only for memories seen in this scan
+        self._block_cache = block_cache
+
         if included_count == 0:
             self._cached_context = None
-            self._cache_dir_mtime = current_mtime
+            self._cache_key = cache_key
             return None
 
         logger.debug(
             f"Memory context: {included_count}/{len(memories)} memories, {total_chars} chars (rebuilt)"
         )
 
-        self._cached_context = "\n".join(lines)
-        self._cache_dir_mtime = current_mtime
+        self._cached_context = buf.getvalue()
+        self._cache_key = cache_key
         return self._cached_context
 
-    def _format_memory(self, memory) -> str:
-        """Format a single memory for context."""
-        lines = [f"## {memory.title}"]
-
+    def _format_memory(self, memory: MarkdownMemory) -> str:
+        """Format a single memory as a markdown block."""
         # Add metadata
         meta_parts = []
         if memory.tags:
             meta_parts.append(f"tags: {', '.join(memory.tags)}")
         if memory.source_session:
             meta_parts.append(f"session: {memory.source_session}")
-        if meta_parts:
-            lines.append(f"({'; '.join(meta_parts)})")
+        meta = f"({'; '.join(meta_parts)})\n" if meta_parts else ""
 
-        lines.append("")
-        # Add content (limit per-memory size)
+        # Add content (limit per-memory size); the marker goes straight into
+        # the f-string so long content is sliced once and copied once
         content = memory.content
+        marker = ""
         if len(content) > 5000:
-            content = content[:5000] + "\n...[truncated]"
-        lines.append(content)
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+            content = content[:5000]
+            marker = "\n...[truncated]"
 
-        return "\n".join(lines)
+        return f"## {memory.title}\n{meta}\n{content}{marker}\n\n---\n"
 
     @property
     def last_scan_count(self) -> int:
@@ -147,7 +200,8 @@ class MemoryScanner:
         the next scan_and_format() call rebuilds the context.
         """
         self._cached_context = None
-        self._cache_dir_mtime = 0.0
+        self._cache_key = None
+        self._last_probe_monotonic = 0.0
 
 
 # Global scanner instance
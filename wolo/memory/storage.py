@@ -3,16 +3,31 @@
 Provides JSON-based storage with file locking for concurrent safety.
 """
 
+import contextlib
 import fcntl
 import json
 import logging
 import os
+import tempfile
+from collections.abc import Iterator
 from pathlib import Path
 
+from wolo import _json
 from wolo.memory.model import Memory
 
 logger = logging.getLogger(__name__)
 
+# Superseded records tolerated in the append-only index before compaction
+INDEX_COMPACT_SLACK = 32
+
+
+def _search_text(title: str, summary: str, tags: list[str]) -> str:
+    """Lower-case title, summary and tags into one NUL-separated string.
+
+    NUL never appears in a query, so a match can't straddle two fields.
+    """
+    return "\0".join([title, summary, *tags]).lower()
+
 
 class MemoryStorage:
     """Storage for long-term memories with file locking.
@@ -20,17 +35,23 @@ class MemoryStorage:
     Directory structure:
     ~/.wolo/memories/
     ├── {memory_id}.json  # Individual memory files
-    └── index.json        # Lightweight search index
+    └── index.jsonl       # Lightweight search index (append-only, one record per line)
     """
 
-    def __init__(self, base_dir: Path | None = None):
+    def __init__(self, base_dir: Path | None = None, fsync: bool | None = None):
         """Initialize MemoryStorage.
 
         Args:
             base_dir: Base directory for storage. Defaults to ~/.wolo/memories
+            fsync: Flush each write to disk before renaming it into place.
+                Defaults to off (WOLO_MEMORY_FSYNC=1 turns it on); atomic
+                rename already keeps each file consistent.
         """
         self.base_dir = base_dir or (Path.home() / ".wolo" / "memories")
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        if fsync is None:
+            fsync = os.getenv("WOLO_MEMORY_FSYNC", "").lower() in ("true", "1", "yes")
+        self._fsync = fsync
 
     def _memory_file(self, memory_id: str) -> Path:
         """Get the file path for a memory."""
@@ -38,45 +59,81 @@ class MemoryStorage:
 
     def _index_file(self) -> Path:
         """Get the index file path."""
+        return self.base_dir / "index.jsonl"
+
+    def _legacy_index_file(self) -> Path:
+        """Get the path of the JSON index written by older versions."""
         return self.base_dir / "index.json"
 
-    def _write_json(self, path: Path, data: dict) -> None:
-        """Write JSON with file locking for safety."""
+    def _write_bytes(self, path: Path, data: bytes) -> None:
+        """Write bytes atomically via a temp file and rename.
+
+        Each write uses its own temp file, so concurrent writers never
+        share one and need no lock: rename is atomic and the last one wins.
+        Read-modify-write sequences take _index_lock() instead.
+        """
         path.parent.mkdir(parents=True, exist_ok=True)
 
         # Write to temp file first, then rename (atomic)
-        temp_path = path.with_suffix(".tmp")
+        fd, temp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
         try:
-            with open(temp_path, "w") as f:
-                # Get exclusive lock
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
-                try:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
+            with open(fd, "wb") as f:
+                f.write(data)
+                if self._fsync:
                     f.flush()
                     os.fsync(f.fileno())
-
-                    # Atomic rename while lock is still held
-                    temp_path.rename(path)
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            os.replace(temp_name, path)
         except Exception as e:
             # Clean up temp file on error
-            if temp_path.exists():
-                temp_path.unlink()
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
             raise e
 
-    def _read_json(self, path: Path) -> dict | None:
-        """Read JSON with file locking."""
-        if not path.exists():
+    @contextlib.contextmanager
+    def _index_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the index across a read-modify-write."""
+        with open(self.base_dir / ".index.lock", "a") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def flush_durable(self) -> None:
+        """Persist the renames of completed writes with one directory fsync.
+
+        For batches written with fsync off, call this once at the end
+        instead of paying an fsync per file.
+        """
+        fd = os.open(self.base_dir, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _read_bytes(self, path: str | Path) -> bytes | None:
+        """Read a whole file; None if it doesn't exist.
+
+        Writers replace files by atomic rename, so a reader always sees a
+        complete file and needs no lock.
+        """
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
             return None
 
+    def _write_json(self, path: Path, data: dict) -> None:
+        """Write JSON atomically."""
+        self._write_bytes(path, _json.dumps_bytes(data, indent=True))
+
+    def _read_json(self, path: str | Path) -> dict | None:
+        """Read JSON; None if the file is missing or unreadable."""
         try:
-            with open(path) as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_SH)
-                try:
-                    return json.load(f)
-                finally:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            raw = self._read_bytes(path)
+            if raw is None:
+                return None
+            return _json.loads(raw)
         except (OSError, json.JSONDecodeError) as e:
             logger.error(f"Failed to read {path}: {e}")
             return None
@@ -132,10 +189,17 @@ class MemoryStorage:
         Returns:
             List of all Memory instances, sorted by created_at (newest first)
         """
+        # One scandir pass; names alone identify memory files, so entries
+        # need no stat and no Path objects
+        with os.scandir(self.base_dir) as it:
+            paths = [
+                entry.path
+                for entry in it
+                if entry.name.endswith(".json") and entry.name != "index.json"
+            ]
+
         memories = []
-        for path in self.base_dir.glob("*.json"):
-            if path.name == "index.json":
-                continue
+        for path in paths:
             data = self._read_json(path)
             if data and "id" in data and "title" in data:
                 memories.append(Memory.from_dict(data))
@@ -155,47 +219,199 @@ class MemoryStorage:
             List of matching Memory instances, sorted by relevance
         """
         query_lower = query.lower()
-        results = []
 
-        for memory in self.list_all():
-            # Tag filter
-            if tag_filter and tag_filter not in memory.tags:
-                continue
+        # Match against the index so only hits are read from disk; fall
+        # back to a full scan when the index can't be read
+        index = self._load_index()
+        if index is None:
+            return [
+                memory
+                for memory in self.list_all()
+                if self._matches(
+                    query_lower,
+                    tag_filter,
+                    memory.tags,
+                    _search_text(memory.title, memory.summary, memory.tags),
+                )
+            ]
+
+        hits = [
+            entry
+            for entry in index.values()
+            if self._matches(
+                query_lower,
+                tag_filter,
+                entry["tags"],
+                # Entries written before search_text existed compute it here
+                entry.get("search_text")
+                or _search_text(entry["title"], entry["summary"], entry["tags"]),
+            )
+        ]
+        # Newest first, same as list_all()
+        hits.sort(key=lambda entry: entry["created_at"], reverse=True)
 
-            # Search in title, summary, tags
-            if (
-                query_lower in memory.title.lower()
-                or query_lower in memory.summary.lower()
-                or any(query_lower in tag.lower() for tag in memory.tags)
-            ):
+        results = []
+        for entry in hits:
+            memory = self.load(entry["id"])
+            if memory is not None:
                 results.append(memory)
-
         return results
 
-    def _update_index(self, memory: Memory) -> None:
-        """Update the search index with a new or updated memory."""
-        index = self._load_index() or {}
+    @staticmethod
+    def _matches(
+        query_lower: str, tag_filter: str | None, tags: list[str], search_text: str
+    ) -> bool:
+        """Check one memory against a search.
+
+        Args:
+            query_lower: Lower-cased query
+            tag_filter: Optional exact tag the memory must have
+            tags: The memory's tags
+            search_text: Lower-cased title, summary and tags (see _search_text)
+        """
+        # Tag filter
+        if tag_filter and tag_filter not in tags:
+            return False
+
+        # Search in title, summary, tags with one substring test
+        return query_lower in search_text
 
-        index[memory.id] = {
+    @staticmethod
+    def _index_entry(memory: Memory) -> dict:
+        """Build the search index entry for a memory."""
+        return {
             "id": memory.id,
             "title": memory.title,
             "summary": memory.summary,
             "tags": memory.tags,
             "created_at": memory.created_at,
+            "search_text": _search_text(memory.title, memory.summary, memory.tags),
         }
 
-        self._write_json(self._index_file(), index)
+    def _update_index(self, memory: Memory) -> None:
+        """Update the search index with a new or updated memory."""
+        self._append_index_record((memory.id, self._index_entry(memory)))
 
     def _remove_from_index(self, memory_id: str) -> None:
         """Remove a memory from the search index."""
-        index = self._load_index()
-        if index and memory_id in index:
-            del index[memory_id]
-            self._write_json(self._index_file(), index)
+        # Tombstone record; no need to load the index to check membership
+        self._append_index_record((memory_id, None))
+
+    @staticmethod
+    def _index_line(memory_id: str, entry: dict | None) -> bytes:
+        """Encode one index record as a JSON line."""
+        return _json.dumps_bytes([memory_id, entry]) + b"\n"
+
+    def _append_index_record(self, record: tuple[str, dict | None]) -> None:
+        """Append one (id, entry-or-None) record to the index file.
+
+        Saves and deletes cost one small append instead of rewriting the
+        whole index; _load_index() replays the records and compacts the
+        file once superseded records pile up.
+        """
+        path = self._index_file()
+        data = self._index_line(*record)
+        with self._index_lock():
+            if not path.exists():
+                # Start from every existing memory, not just this record
+                self._rebuild_index()
+            with open(path, "ab") as f:
+                f.write(data)
+                if self._fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+
+    def _write_index(self, index: dict) -> None:
+        """Write the search index as one record per live entry.
+
+        Compact JSON lines rather than indented JSON: the index is
+        machine-only state, and the same format takes appended records.
+        """
+        line = self._index_line
+        self._write_bytes(
+            self._index_file(),
+            b"".join(line(memory_id, entry) for memory_id, entry in index.items()),
+        )
+
+    def _read_index_records(self) -> tuple[dict | None, int, bool]:
+        """Replay the index file into a dict.
+
+        Returns:
+            (index, number of records read, whether any record was
+            unreadable); index is None if there is no index file
+        """
+        path = self._index_file()
+        raw = self._read_bytes(path)
+        if raw is None:
+            return None, 0, False
+
+        index: dict = {}
+        records = 0
+        damaged = False
+        for line in raw.splitlines():
+            try:
+                memory_id, entry = _json.loads(line)
+            except (ValueError, TypeError) as e:
+                # A torn append; the index no longer covers every memory
+                logger.warning(f"Unreadable record in {path}: {e}")
+                damaged = True
+                continue
+            records += 1
+            if entry is None:
+                index.pop(memory_id, None)
+            else:
+                index[memory_id] = entry
+        return index, records, damaged
+
+    def _rebuild_index(self) -> dict:
+        """Write the index afresh; the caller holds _index_lock().
+
+        Converts a legacy index.json when there is no index yet, and
+        otherwise indexes the memory files themselves. The legacy file is
+        left in place, so older versions can still use it.
+
+        Returns:
+            The new index
+        """
+        index = None
+        if not self._index_file().exists():
+            index = self._read_json(self._legacy_index_file())
+        if index is None:
+            index = {memory.id: self._index_entry(memory) for memory in self.list_all()}
+        self._write_index(index)
+        return index
+
+    def _compact_index(self) -> None:
+        """Rewrite the index as one snapshot, dropping superseded records."""
+        with self._index_lock():
+            index, _, damaged = self._read_index_records()
+            if index is None or damaged:
+                self._rebuild_index()
+            else:
+                self._write_index(index)
 
     def _load_index(self) -> dict | None:
-        """Load the search index."""
-        return self._read_json(self._index_file())
+        """Load the search index, rebuilding it if it is missing or damaged.
+
+        Returns:
+            The index, or None if it can't be read
+        """
+        try:
+            index, records, damaged = self._read_index_records()
+            if index is not None and not damaged:
+                if records > 2 * len(index) + INDEX_COMPACT_SLACK:
+                    self._compact_index()
+                return index
+
+            # Check again under the lock: another writer may have rebuilt it
+            with self._index_lock():
+                index, _, damaged = self._read_index_records()
+                if index is None or damaged:
+                    index = self._rebuild_index()
+                return index
+        except OSError as e:
+            logger.error(f"Failed to read {self._index_file()}: {e}")
+            return None
 
 
 # Global storage instance
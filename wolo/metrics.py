@@ -1,12 +1,15 @@
 """Metrics collection for benchmarking Wolo agent performance."""
 
-import json
+import io
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
+from wolo import _json
 
-@dataclass
+
+@dataclass(slots=True)
 class StepMetrics:
     """Metrics collected during a single agent loop step."""
 
@@ -31,7 +34,7 @@ class StepMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionMetrics:
     """Metrics collected during an agent session."""
 
@@ -45,11 +48,13 @@ class SessionMetrics:
     total_completion_tokens: int = 0
     tool_calls: int = 0
     tool_errors: int = 0
-    tools_by_name: dict[str, int] = field(default_factory=dict)
-    errors_by_category: dict[str, int] = field(default_factory=dict)
+    tools_by_name: Counter[str] = field(default_factory=Counter)
+    errors_by_category: Counter[str] = field(default_factory=Counter)
     finish_reason: str = ""
     subagent_sessions: list[str] = field(default_factory=list)
     steps: list[StepMetrics] = field(default_factory=list)
+    # Running sum of step LLM latencies, kept by record_step()
+    _llm_latency_sum_ms: float = field(default=0.0, init=False, repr=False)
 
     @property
     def total_duration_ms(self) -> float:
@@ -68,7 +73,7 @@ class SessionMetrics:
         """Average LLM latency in milliseconds."""
         if self.llm_calls == 0:
             return 0.0
-        return sum(s.llm_latency_ms for s in self.steps) / self.llm_calls
+        return self._llm_latency_sum_ms / self.llm_calls
 
     @property
     def avg_step_duration_ms(self) -> float:
@@ -82,19 +87,21 @@ class SessionMetrics:
         self.steps.append(step_metrics)
         self.total_steps = step_metrics.step_number
         self.llm_calls += 1
+        self._llm_latency_sum_ms += step_metrics.llm_latency_ms
         self.total_prompt_tokens += step_metrics.prompt_tokens
         self.total_completion_tokens += step_metrics.completion_tokens
         self.tool_calls += len(step_metrics.tool_calls)
 
-        # Track tools by name
-        for tc in step_metrics.tool_calls:
-            tool_name = tc.get("tool", tc.get("function", {}).get("name", "unknown"))
-            self.tools_by_name[tool_name] = self.tools_by_name.get(tool_name, 0) + 1
+        # Track tools by name (Counter.update counts in C)
+        self.tools_by_name.update(
+            tc["tool"] if "tool" in tc else tc.get("function", {}).get("name", "unknown")
+            for tc in step_metrics.tool_calls
+        )
 
     def record_tool_error(self, tool_name: str, error_category: str) -> None:
         """Record a tool error."""
         self.tool_errors += 1
-        self.errors_by_category[error_category] = self.errors_by_category.get(error_category, 0) + 1
+        self.errors_by_category[error_category] += 1
 
     def record_subagent_session(self, subsession_id: str) -> None:
         """Record a spawned subagent session."""
@@ -120,8 +127,8 @@ class SessionMetrics:
             "total_tokens": self.total_tokens,
             "tool_calls": self.tool_calls,
             "tool_errors": self.tool_errors,
-            "tools_by_name": self.tools_by_name,
-            "errors_by_category": self.errors_by_category,
+            "tools_by_name": dict(self.tools_by_name),
+            "errors_by_category": dict(self.errors_by_category),
             "finish_reason": self.finish_reason,
             "subagent_count": len(self.subagent_sessions),
             "subagent_sessions": self.subagent_sessions,
@@ -133,11 +140,14 @@ class MetricsCollector:
     """Singleton collector for session metrics."""
 
     _instance: "MetricsCollector | None" = None
-    _sessions: dict[str, SessionMetrics] = {}
+    _sessions: dict[str, SessionMetrics]
 
     def __new__(cls) -> "MetricsCollector":
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            instance = super().__new__(cls)
+            # Per-instance state, set once when the singleton is created
+            instance._sessions = {}
+            cls._instance = instance
         return cls._instance
 
     def create_session(self, session_id: str, agent_type: str) -> SessionMetrics:
@@ -175,8 +185,9 @@ class MetricsCollector:
 
     def save_to_file(self, file_path: str) -> None:
         """Save all metrics to a JSON file."""
-        with open(file_path, "w") as f:
-            json.dump(self.export_all(), f, indent=2, default=str)
+        data = self.export_all()
+        with open(file_path, "wb") as f:
+            f.write(_json.dumps_bytes(data, indent=True, default=str))
 
 
 def generate_report(results: list[dict[str, Any]]) -> str:
@@ -189,19 +200,18 @@ def generate_report(results: list[dict[str, Any]]) -> str:
     Returns:
         Formatted report string
     """
-    report_lines = []
-    report_lines.append("=" * 80)
-    report_lines.append("WOLO BENCHMARK RESULTS")
-    report_lines.append("=" * 80)
-    report_lines.append("")
+    rule = "=" * 80
+    buf = io.StringIO()
+    w = buf.write
+    w(f"{rule}\nWOLO BENCHMARK RESULTS\n{rule}\n\n")
 
     if not results:
-        report_lines.append("No benchmark results available.")
-        return "\n".join(report_lines)
+        w("No benchmark results available.")
+        return buf.getvalue()
 
     # Summary table
-    report_lines.append(f"{'Test':<25} {'Steps':<8} {'Tokens':<10} {'Tools':<8} {'Duration':<12}")
-    report_lines.append("-" * 80)
+    w(f"{'Test':<25} {'Steps':<8} {'Tokens':<10} {'Tools':<8} {'Duration':<12}\n")
+    w("-" * 80 + "\n")
 
     for r in results:
         name = r.get("name", r.get("session_id", "unknown")[:25])
@@ -209,35 +219,35 @@ def generate_report(results: list[dict[str, Any]]) -> str:
         tokens = r.get("total_tokens", 0)
         tools = r.get("tool_calls", 0)
         duration = f"{r.get('total_duration_ms', 0):.0f}ms"
-        report_lines.append(f"{name:<25} {steps:<8} {tokens:<10} {tools:<8} {duration:<12}")
+        w(f"{name:<25} {steps:<8} {tokens:<10} {tools:<8} {duration:<12}\n")
 
-    report_lines.append("")
-    report_lines.append("DETAILED METRICS:")
-    report_lines.append("-" * 80)
+    w("\nDETAILED METRICS:\n")
+    w("-" * 80 + "\n")
 
     for r in results:
         name = r.get("name", r.get("session_id", "unknown"))
-        report_lines.append(f"\n{name}:")
-        report_lines.append(f"  Agent: {r.get('agent_type', 'unknown')}")
-        report_lines.append(f"  Finish Reason: {r.get('finish_reason', 'unknown')}")
-        report_lines.append(f"  LLM Calls: {r.get('llm_calls', 0)}")
-        report_lines.append(f"  Avg LLM Latency: {r.get('avg_llm_latency_ms', 0):.0f}ms")
-        report_lines.append(f"  Avg Step Duration: {r.get('avg_step_duration_ms', 0):.0f}ms")
-        report_lines.append(f"  Prompt Tokens: {r.get('total_prompt_tokens', 0)}")
-        report_lines.append(f"  Completion Tokens: {r.get('total_completion_tokens', 0)}")
-        report_lines.append(f"  Total Tokens: {r.get('total_tokens', 0)}")
-        report_lines.append(f"  Tool Calls: {r.get('tool_calls', 0)}")
-        report_lines.append(f"  Tool Errors: {r.get('tool_errors', 0)}")
-        report_lines.append(f"  Subagent Sessions: {r.get('subagent_count', 0)}")
+        w(
+            f"\n{name}:\n"
+            f"  Agent: {r.get('agent_type', 'unknown')}\n"
+            f"  Finish Reason: {r.get('finish_reason', 'unknown')}\n"
+            f"  LLM Calls: {r.get('llm_calls', 0)}\n"
+            f"  Avg LLM Latency: {r.get('avg_llm_latency_ms', 0):.0f}ms\n"
+            f"  Avg Step Duration: {r.get('avg_step_duration_ms', 0):.0f}ms\n"
+            f"  Prompt Tokens: {r.get('total_prompt_tokens', 0)}\n"
+            f"  Completion Tokens: {r.get('total_completion_tokens', 0)}\n"
+            f"  Total Tokens: {r.get('total_tokens', 0)}\n"
+            f"  Tool Calls: {r.get('tool_calls', 0)}\n"
+            f"  Tool Errors: {r.get('tool_errors', 0)}\n"
+            f"  Subagent Sessions: {r.get('subagent_count', 0)}\n"
+        )
 
         tools_by_name = r.get("tools_by_name", {})
         if tools_by_name:
-            report_lines.append(f"  Tools Used: {tools_by_name}")
+            w(f"  Tools Used: {tools_by_name}\n")
 
         errors_by_category = r.get("errors_by_category", {})
         if errors_by_category:
-            report_lines.append(f"  Errors by Category: {errors_by_category}")
+            w(f"  Errors by Category: {errors_by_category}\n")
 
-    report_lines.append("")
-    report_lines.append("=" * 80)
-    return "\n".join(report_lines)
+    w(f"\n{rule}")
+    return buf.getvalue()
@@ -34,12 +34,13 @@ class ExecutionMode(Enum):
     REPL = "repl"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ModeConfig:
     """
     Configuration for an execution mode (simplified).
 
     Determines which features are enabled and how the agent behaves.
+    Instances are immutable; for_mode() hands out shared ones.
     """
 
     mode: ExecutionMode
@@ -49,7 +50,7 @@ class ModeConfig:
     @classmethod
     def for_mode(cls, mode: ExecutionMode) -> "ModeConfig":
         """
-        Create configuration for a specific mode.
+        Get the configuration for a specific mode.
 
         Args:
             mode: The execution mode
@@ -63,26 +64,30 @@ class ModeConfig:
             | enable_question_tool | False | True  | True  |
             | exit_after_task      | True  | True  | False |
         """
-        if mode == ExecutionMode.SOLO:
-            return cls(
-                mode=mode,
-                enable_question_tool=False,  # SOLO: no questions
-                exit_after_task=True,
-            )
-        elif mode == ExecutionMode.COOP:
-            return cls(
-                mode=mode,
-                enable_question_tool=True,  # COOP: questions allowed
-                exit_after_task=True,
-            )
-        elif mode == ExecutionMode.REPL:
-            return cls(
-                mode=mode,
-                enable_question_tool=True,  # REPL: questions allowed
-                exit_after_task=False,  # REPL: loops continuously
-            )
-        else:
-            raise ValueError(f"Unknown mode: {mode}")
+        try:
+            return _MODE_CONFIGS[mode]
+        except KeyError:
+            raise ValueError(f"Unknown mode: {mode}") from None
+
+
+# One immutable config per mode, built once at import
+_MODE_CONFIGS: dict[ExecutionMode, ModeConfig] = {
+    ExecutionMode.SOLO: ModeConfig(
+        mode=ExecutionMode.SOLO,
+        enable_question_tool=False,  # SOLO: no questions
+        exit_after_task=True,
+    ),
+    ExecutionMode.COOP: ModeConfig(
+        mode=ExecutionMode.COOP,
+        enable_question_tool=True,  # COOP: questions allowed
+        exit_after_task=True,
+    ),
+    ExecutionMode.REPL: ModeConfig(
+        mode=ExecutionMode.REPL,
+        enable_question_tool=True,  # REPL: questions allowed
+        exit_after_task=False,  # REPL: loops continuously
+    ),
+}
 
 
 @dataclass
@@ -5,12 +5,75 @@ This module contains the pure path checking logic with no external
 dependencies. It's testable in isolation and follows single responsibility.
 """
 
+import os
+import re
+import stat
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import TYPE_CHECKING
 
-if TYPE_CHECKING:
-    from wolo.path_guard.models import CheckResult
+from wolo.path_guard.models import READ_ALLOWED, CheckResult, Operation
+
+# Marks a trie node whose path is itself an entry
+_TERMINAL = object()
+
+# Stand-in for the pattern of an empty trie
+_NEVER_MATCHES = re.compile(r"(?!)")
+
+
+def _trie_add(trie: dict, path: str) -> None:
+    """Insert a directory into a path-component trie.
+
+    Components come from splitting the string form on os.sep, so neither
+    building nor querying the trie goes through PurePath.
+
+    Args:
+        trie: Nested dicts keyed by path component
+        path: String form of a normalized absolute directory
+    """
+    node = trie
+    # rstrip so "/" is the single root component "" rather than ["", ""]
+    for part in path.rstrip(os.sep).split(os.sep):
+        node = node.setdefault(part, {})
+    node[_TERMINAL] = True
+
+
+def _trie_copy(trie: dict) -> dict:
+    """Copy a trie's nested dicts (deepcopy would clone the _TERMINAL key)."""
+    return {part: child if part is _TERMINAL else _trie_copy(child) for part, child in trie.items()}
+
+
+def _trie_pattern(trie: dict) -> re.Pattern[str]:
+    """Compile a trie into a regex matching any path at or beneath an entry.
+
+    The alternation is nested the way the trie is, so shared leading
+    components appear once and re matches a path in a single C-level pass.
+
+    Args:
+        trie: Trie built with _trie_add()
+
+    Returns:
+        Pattern whose match() succeeds for paths covered by the trie
+    """
+    if not trie:
+        return _NEVER_MATCHES
+    return re.compile(_node_pattern(trie))
+
+
+def _node_pattern(node: dict) -> str:
+    """Regex source for the subtree under one trie node."""
+    sep = re.escape(os.sep)
+    alternatives = []
+    for part, child in node.items():
+        if part is _TERMINAL:
+            continue
+        if _TERMINAL in child:
+            # An entry: the path is it, or continues below it. \Z, not $,
+            # which would also accept a trailing newline in the file name
+            alternatives.append(f"{re.escape(part)}(?:{sep}|\\Z)")
+        else:
+            alternatives.append(f"{re.escape(part)}{sep}{_node_pattern(child)}")
+    return f"(?:{'|'.join(alternatives)})"
 
 
 @dataclass(frozen=True)
@@ -39,57 +102,45 @@ class PathWhitelist:
     # Default safe directory
     _default_allowed: set[Path] = field(default_factory=lambda: {Path("/tmp").resolve()})
 
-    def is_whitelisted(self, path: Path) -> bool:
+    # Component trie of every entry, resolved once here (confirmed dirs are
+    # taken as stored) so is_whitelisted() makes no syscalls
+    _trie: dict = field(init=False, repr=False, compare=False)
+    # The trie compiled to one regex, so a lookup is a single match() call
+    _pattern: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        trie: dict = {}
+        workdir = {self.workdir} if self.workdir else set()
+        for entries in (workdir, self.cli_paths, self.config_paths, self._default_allowed):
+            for entry in entries:
+                try:
+                    resolved = os.path.realpath(entry)
+                except OSError:
+                    resolved = str(entry)
+                _trie_add(trie, resolved)
+        # Confirmed directories were resolved when the user confirmed them.
+        # Resolving again would follow a symlink swapped in since, granting
+        # a target the user never approved
+        for entry in self.confirmed_dirs:
+            _trie_add(trie, str(entry))
+        # Frozen dataclass: derived fields have to bypass __setattr__
+        object.__setattr__(self, "_trie", trie)
+        object.__setattr__(self, "_pattern", _trie_pattern(trie))
+
+    def is_whitelisted(self, path: str | Path) -> bool:
         """Check if a path is in the whitelist.
 
         Args:
-            path: Normalized absolute path to check
+            path: Normalized absolute path to check (or its string form)
 
         Returns:
-            True if path is whitelisted, False otherwise
+            True if path is whitelisted, False otherwise. Relative paths never
+            match: every entry is absolute, so the lookup fails at the first
+            component without raising.
         """
-        # 1. Check workdir (highest priority)
-        if self.workdir:
-            try:
-                resolved = path.resolve()
-                if resolved.is_relative_to(self.workdir) or resolved == self.workdir:
-                    return True
-            except (OSError, RuntimeError):
-                pass
-
-        # 2. Check default allowed (/tmp)
-        for allowed in self._default_allowed:
-            try:
-                if path.is_relative_to(allowed) or path == allowed:
-                    return True
-            except (OSError, RuntimeError):
-                pass
-
-        # 3. Check CLI paths
-        for cli_path in self.cli_paths:
-            try:
-                if path.is_relative_to(cli_path) or path == cli_path:
-                    return True
-            except (OSError, RuntimeError):
-                pass
-
-        # 4. Check config paths
-        for config_path in self.config_paths:
-            try:
-                if path.is_relative_to(config_path) or path == config_path:
-                    return True
-            except (OSError, RuntimeError):
-                pass
-
-        # 5. Check confirmed directories
-        for confirmed in self.confirmed_dirs:
-            try:
-                if path.is_relative_to(confirmed):
-                    return True
-            except (OSError, RuntimeError):
-                pass
-
-        return False
+        # All sources (workdir, CLI, config, /tmp, confirmed) share one pattern;
+        # path is already resolved by the caller, so it isn't resolved again
+        return self._pattern.match(str(path)) is not None
 
 
 class PathChecker:
@@ -98,6 +149,12 @@ class PathChecker:
     This class is pure logic with no side effects. It doesn't do I/O,
     doesn't interact with the user, and doesn't depend on global state.
 
+    Every check resolves the path again (symlinks can change between
+    checks); only the whitelist lookup is memoized, keyed on the resolved
+    path (up to CHECK_CACHE_SIZE entries, least recently used evicted
+    first). Confirming a directory drops the memoized results that weren't
+    allowed.
+
     Usage:
         checker = PathChecker(whitelist=config.get_whitelist())
         result = checker.check("/tmp/file.txt", Operation.WRITE)
@@ -107,6 +164,8 @@ class PathChecker:
             # Handle denial
     """
 
+    CHECK_CACHE_SIZE = 1024
+
     def __init__(self, whitelist: PathWhitelist) -> None:
         """Initialize with a whitelist configuration.
 
@@ -115,8 +174,15 @@ class PathChecker:
         """
         self._whitelist = whitelist
         self._confirmed_dirs: set[Path] = set(whitelist.confirmed_dirs)
-
-    def check(self, path: str | Path, operation) -> "CheckResult":
+        # The whitelist's entries plus directories confirmed this session in
+        # one trie/pattern, so a check is a single match(); the whitelist
+        # itself stays immutable
+        self._trie = _trie_copy(whitelist._trie)
+        self._pattern = whitelist._pattern
+        # (resolved path string, operation) -> result, most recently used last
+        self._cache: OrderedDict[tuple[str, Operation], CheckResult] = OrderedDict()
+
+    def check(self, path: str | Path, operation) -> CheckResult:
         """Check if a path operation is allowed.
 
         Args:
@@ -126,33 +192,76 @@ class PathChecker:
         Returns:
             CheckResult with the check outcome
         """
-        from wolo.path_guard.models import CheckResult, Operation
-
         # Read operations are always allowed (KISS principle)
-        if operation == Operation.READ:
-            return CheckResult.allowed_for(operation)
+        if operation is Operation.READ:
+            return READ_ALLOWED
 
-        # Normalize the path
+        # Resolve on every call: a memo keyed on the input would keep
+        # answering for a path whose symlinks have since been changed
         try:
-            normalized = Path(path).resolve()
+            normalized = self._resolve(path)
         except (OSError, RuntimeError) as e:
-            return CheckResult.denied(
-                Path(path) if isinstance(path, Path) else Path(path),
-                operation,
-                f"path resolution failed: {e}",
-            )
+            return CheckResult.denied(Path(path), operation, f"path resolution failed: {e}")
+
+        key = (normalized, operation)
+        cache = self._cache
+        result = cache.get(key)
+        if result is not None:
+            cache.move_to_end(key)
+            return result
+        # Check whitelist and confirmed directories. Matching works on the
+        # string; a Path is only built for the message of a result that
+        # needs confirmation
+        if self._pattern.match(normalized):
+            result = CheckResult.allowed_for(operation)
+        else:
+            result = CheckResult.needs_confirmation(Path(normalized), operation)
+        cache[key] = result
+        if len(cache) > self.CHECK_CACHE_SIZE:
+            cache.popitem(last=False)
+        return result
+
+    def check_many(self, paths: list[str | Path], operation: Operation) -> list[CheckResult]:
+        """Check several paths for the same operation.
+
+        Shares the memo and compiled whitelist across the batch, so tool
+        calls with many paths (e.g. glob-expanded writes) pay the per-call
+        overhead once; paths that need confirmation can then be confirmed
+        together.
 
-        # Check whitelist
-        if self._whitelist.is_whitelisted(normalized):
-            return CheckResult.allowed_for(operation)
+        Args:
+            paths: Paths to check
+            operation: Operation type (from Operation enum)
 
-        # Check confirmed directories
-        for confirmed in self._confirmed_dirs:
-            if normalized.is_relative_to(confirmed):
-                return CheckResult.allowed_for(operation)
+        Returns:
+            One CheckResult per path, in the same order
+        """
+        if operation is Operation.READ:
+            return [READ_ALLOWED] * len(paths)
+        check = self.check
+        return [check(path, operation) for path in paths]
 
-        # Requires confirmation
-        return CheckResult.needs_confirmation(normalized, operation)
+    @staticmethod
+    def _resolve(path: str | Path) -> str:
+        """Normalize a path to its real absolute string form.
+
+        Absolute inputs (what the tool layer passes) go straight to
+        realpath(): Path.resolve() would parse the string into a PurePath
+        first and stat() the result again just to detect loops.
+
+        Args:
+            path: Path to resolve
+
+        Returns:
+            The resolved path string
+
+        Raises:
+            OSError: If the path can't be resolved
+            RuntimeError: If a symlink loop is found while resolving a relative path
+        """
+        if os.path.isabs(path):
+            return os.path.realpath(path)
+        return str(Path(path).resolve())
 
     def confirm_directory(self, directory: str | Path) -> None:
         """Mark a directory as confirmed by the user.
@@ -163,16 +272,25 @@ class PathChecker:
         Args:
             directory: Directory or file path to confirm
         """
-        normalized = Path(directory).resolve()
-
-        # For files, use parent directory
-        if normalized.is_file():
-            normalized = normalized.parent
-        elif not normalized.exists():
+        # One stat() of the real path tells file, directory and missing apart
+        normalized = os.path.realpath(directory)
+        try:
+            use_parent = stat.S_ISREG(os.stat(normalized).st_mode)
+        except OSError:
             # For non-existent paths, use parent directory
-            normalized = normalized.parent
-
-        self._confirmed_dirs.add(normalized)
+            use_parent = True
+        # For files, use parent directory
+        if use_parent:
+            normalized = os.path.dirname(normalized)
+
+        self._confirmed_dirs.add(Path(normalized))
+        _trie_add(self._trie, normalized)
+        self._pattern = _trie_pattern(self._trie)
+        # Results that needed confirmation may now be allowed; allowed ones
+        # stay valid, since confirming only ever adds to the whitelist
+        cache = self._cache
+        for key in [key for key, result in cache.items() if not result.allowed]:
+            del cache[key]
 
     def get_confirmed_dirs(self) -> list[Path]:
         """Get list of confirmed directories.
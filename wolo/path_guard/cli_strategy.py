@@ -1,11 +1,13 @@
 # wolo/path_guard/cli_strategy.py
 """CLI-based confirmation strategy (simplified - no rich, no UI)."""
 
-import json
+import os
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import BinaryIO
 
+from wolo import _json
 from wolo.path_guard.exceptions import SessionCancelled
 from wolo.path_guard.strategy import ConfirmationStrategy
 
@@ -31,25 +33,45 @@ class CLIConfirmationStrategy(ConfirmationStrategy):
         self._confirmation_count = 0
         self._audit_denied = audit_denied
         self._audit_log_file = audit_log_file
+        # Opened on the first denial and kept for the session
+        self._audit_fh: BinaryIO | None = None
+        # sys.stdin.isatty(), checked on the first prompt and then reused
+        self._stdin_is_tty: bool | None = None
+
+        # Resolved once here instead of on every prompt. It can't be a
+        # module-level import: the package __init__ imports this module
+        # before it defines get_path_guard
+        from wolo.path_guard import get_path_guard
+
+        self._get_path_guard = get_path_guard
 
     def _audit_denial(self, path: str, operation: str, reason: str) -> None:
         """Append a denial audit entry."""
         if not self._audit_denied or self._audit_log_file is None:
             return
         try:
-            self._audit_log_file.parent.mkdir(parents=True, exist_ok=True)
+            if self._audit_fh is None:
+                self._audit_log_file.parent.mkdir(parents=True, exist_ok=True)
+                # Unbuffered: each entry reaches the file with a single
+                # write() instead of an open/write/close per denial
+                self._audit_fh = open(self._audit_log_file, "ab", buffering=0)
             entry = {
                 "timestamp": datetime.now().isoformat(),
                 "path": path,
                 "operation": operation,
                 "reason": reason,
             }
-            with open(self._audit_log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(entry, ensure_ascii=True) + "\n")
+            self._audit_fh.write(_json.dumps_bytes(entry) + b"\n")
         except Exception:
             # Auditing should never break tool execution.
             pass
 
+    def close(self) -> None:
+        """Close the audit log handle, if one was opened."""
+        if self._audit_fh is not None:
+            self._audit_fh.close()
+            self._audit_fh = None
+
     async def confirm(self, path: str, operation: str) -> bool:
         """Request user confirmation via CLI prompt.
 
@@ -63,21 +85,20 @@ class CLIConfirmationStrategy(ConfirmationStrategy):
         Raises:
             SessionCancelled: If user enters 'q' to cancel the session
         """
-        # Import here to avoid circular dependency during refactor
-        from wolo.path_guard import get_path_guard
-
         try:
-            resolved_path = str(Path(path).resolve())
+            resolved_path = os.path.realpath(path)
         except (OSError, RuntimeError):
             resolved_path = path
 
-        print()
-        print("Path Confirmation Required")
-        print(f"Operation: {operation}")
-        print(f"Path: {path}")
-        if resolved_path != path:
-            print(f"Resolved Path: {resolved_path}")
-        print("This path is not in the default allowlist (/tmp) or configured whitelist.")
+        # One print (one write to a line-buffered TTY) for the whole header
+        resolved_line = f"Resolved Path: {resolved_path}\n" if resolved_path != path else ""
+        print(
+            f"\nPath Confirmation Required\n"
+            f"Operation: {operation}\n"
+            f"Path: {path}\n"
+            f"{resolved_line}"
+            "This path is not in the default allowlist (/tmp) or configured whitelist."
+        )
 
         if (
             self._max_confirmations_per_session is not None
@@ -88,7 +109,9 @@ class CLIConfirmationStrategy(ConfirmationStrategy):
             return False
 
         # Non-interactive mode: auto-deny
-        if not sys.stdin.isatty():
+        if self._stdin_is_tty is None:
+            self._stdin_is_tty = sys.stdin.isatty()
+        if not self._stdin_is_tty:
             print("Non-interactive mode, operation denied.")
             self._audit_denial(path, operation, "non_interactive_auto_deny")
             return False
@@ -99,7 +122,7 @@ class CLIConfirmationStrategy(ConfirmationStrategy):
 
             if response in ("", "y", "yes"):
                 # Allow this specific path
-                guard = get_path_guard()
+                guard = self._get_path_guard()
                 guard.confirm_directory(resolved_path)
                 self._confirmation_count += 1
                 return True
@@ -109,8 +132,8 @@ class CLIConfirmationStrategy(ConfirmationStrategy):
                 return False
             elif response == "a":
                 # Allow parent directory and all subdirectories
-                guard = get_path_guard()
-                parent = Path(resolved_path).parent
+                guard = self._get_path_guard()
+                parent = os.path.dirname(resolved_path)
                 guard.confirm_directory(parent)
                 self._confirmation_count += 1
                 print(f"Added {parent} and subdirectories to session whitelist")
@@ -2,16 +2,22 @@
 """Configuration management for PathGuard."""
 
 from dataclasses import dataclass, field
+from os.path import realpath
 from pathlib import Path
 from typing import Any
 
 from wolo.path_guard.checker import PathChecker, PathWhitelist
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PathGuardConfig:
     """Configuration for PathGuard path protection.
 
+    Paths are resolved once, at construction; whitelists created later
+    reuse the resolved forms. The config is frozen so the resolved forms
+    can't fall out of step with reassigned fields (build a new config
+    instead of editing the path lists in place).
+
     Attributes:
         config_paths: Paths from config file (path_safety.allowed_write_paths)
         cli_paths: Paths from --allow-path/-P CLI arguments
@@ -22,6 +28,22 @@ class PathGuardConfig:
     cli_paths: list[Path] = field(default_factory=list)
     workdir: Path | None = None
 
+    _resolved_config: frozenset[Path] = field(init=False, repr=False, compare=False)
+    _resolved_cli: frozenset[Path] = field(init=False, repr=False, compare=False)
+    _resolved_workdir: Path | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields have to bypass __setattr__
+        object.__setattr__(
+            self, "_resolved_config", frozenset(Path(realpath(p)) for p in self.config_paths)
+        )
+        object.__setattr__(
+            self, "_resolved_cli", frozenset(Path(realpath(p)) for p in self.cli_paths)
+        )
+        object.__setattr__(
+            self, "_resolved_workdir", Path(realpath(self.workdir)) if self.workdir else None
+        )
+
     def create_whitelist(self, confirmed_dirs: set[Path]) -> PathWhitelist:
         """Create a PathWhitelist from this configuration.
 
@@ -32,9 +54,9 @@ class PathGuardConfig:
             PathWhitelist configured with all path sources
         """
         return PathWhitelist(
-            config_paths=set(p.resolve() for p in self.config_paths),
-            cli_paths=set(p.resolve() for p in self.cli_paths),
-            workdir=Path(self.workdir).resolve() if self.workdir else None,
+            config_paths=set(self._resolved_config),
+            cli_paths=set(self._resolved_cli),
+            workdir=self._resolved_workdir,
             confirmed_dirs=confirmed_dirs,
         )
 
@@ -69,7 +91,7 @@ class PathGuardConfig:
         return cls(
             config_paths=[Path(p).expanduser() for p in config_paths],
             cli_paths=[Path(p).expanduser() for p in cli_paths],
-            workdir=Path(workdir).expanduser().resolve() if workdir else None,
+            workdir=Path(realpath(Path(workdir).expanduser())) if workdir else None,
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -36,6 +36,10 @@ class PathGuardMiddleware:
         self._checker = checker
         self._strategy = strategy
 
+    def close(self) -> None:
+        """Release resources held by the confirmation strategy."""
+        self._strategy.close()
+
     async def execute_with_path_check(
         self,
         tool_func: Callable[..., Awaitable[dict[str, Any]]],
@@ -63,7 +67,11 @@ class PathGuardMiddleware:
 
         # Handle confirmation
         if check_result.requires_confirmation:
-            allowed = await self._strategy.confirm(file_path, operation.value)
+            # Constant strategies answer without a coroutine round trip;
+            # getattr because strategies are duck-typed
+            allowed = getattr(self._strategy, "TRIVIAL_RESULT", None)
+            if allowed is None:
+                allowed = await self._strategy.confirm(file_path, operation.value)
             if not allowed:
                 return {
                     "output": f"Permission denied by user: {file_path}",
@@ -23,7 +23,15 @@ class CheckResult:
 
     @classmethod
     def allowed_for(cls, operation: Operation) -> "CheckResult":
-        """Create a result for an allowed operation."""
+        """Return the result for an allowed operation.
+
+        The result depends only on the operation and instances are frozen,
+        so one prebuilt instance per operation is shared.
+        """
+        cached = _ALLOWED_RESULTS.get(operation)
+        if cached is not None:
+            return cached
+        # Some callers pass the operation's string value
         return cls(
             allowed=True,
             requires_confirmation=False,
@@ -50,3 +58,18 @@ class CheckResult:
             reason=f"Operation '{operation.value}' on {path} denied: {reason}",
             operation=operation,
         )
+
+
+# One allowed result per operation, handed out by CheckResult.allowed_for()
+_ALLOWED_RESULTS: dict[Operation, CheckResult] = {
+    operation: CheckResult(
+        allowed=True,
+        requires_confirmation=False,
+        reason="Operation allowed",
+        operation=operation,
+    )
+    for operation in Operation
+}
+
+# Shared result for READ checks, which are always allowed
+READ_ALLOWED = _ALLOWED_RESULTS[Operation.READ]
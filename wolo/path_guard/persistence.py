@@ -5,6 +5,8 @@ import json
 from datetime import datetime
 from pathlib import Path
 
+from wolo import _json
+
 
 class PathGuardPersistence:
     """Persistence layer for PathGuard session data.
@@ -56,8 +58,10 @@ class PathGuardPersistence:
             "last_updated": datetime.now().isoformat(),
         }
 
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=2)
+        # Compact output: the file is machine-read on resume, so indenting
+        # only costs time. It stays ASCII-only JSON (not orjson's raw UTF-8),
+        # because session.py reads the same file with the locale encoding
+        file_path.write_bytes(json.dumps(data, separators=(",", ":")).encode("ascii"))
 
     def load_confirmed_dirs(self, session_id: str) -> list[Path]:
         """Load confirmed directories for a session.
@@ -69,10 +73,12 @@ class PathGuardPersistence:
             List of confirmed directory paths, or empty list if file doesn't exist
         """
         file_path = self._get_confirmation_file(session_id)
-        if not file_path.exists():
+        try:
+            raw = file_path.read_bytes()
+        except FileNotFoundError:
             return []
 
-        with open(file_path) as f:
-            data = json.load(f)
+        # Parse the bytes directly; orjson is used when installed
+        data = _json.loads(raw)
 
         return [Path(p) for p in data.get("confirmed_dirs", [])]
@@ -10,8 +10,22 @@ class ConfirmationStrategy(ABC):
     Implementations of this interface handle user interaction for
     path confirmation requests. Different strategies can be used
     for CLI, web UI, automated testing, or non-interactive modes.
+
+    Attributes:
+        TRIVIAL_RESULT: Answer the strategy always gives without asking
+            anyone, or None if confirm() has to be awaited. Lets the
+            middleware skip creating a coroutine for constant strategies.
+            Subclasses that override confirm() get None again unless they
+            set it themselves, so an inherited constant never skips them.
     """
 
+    TRIVIAL_RESULT: bool | None = None
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "confirm" in cls.__dict__ and "TRIVIAL_RESULT" not in cls.__dict__:
+            cls.TRIVIAL_RESULT = None
+
     @abstractmethod
     async def confirm(self, path: str, operation: str) -> bool:
         """Request user confirmation for a path operation.
@@ -28,6 +42,9 @@ class ConfirmationStrategy(ABC):
         """
         pass
 
+    def close(self) -> None:
+        """Release resources held by the strategy (none by default)."""
+
 
 class AutoDenyConfirmationStrategy(ConfirmationStrategy):
     """Always denies (for non-interactive mode).
@@ -36,6 +53,8 @@ class AutoDenyConfirmationStrategy(ConfirmationStrategy):
     where user interaction is not possible (e.g., CI/CD, API mode).
     """
 
+    TRIVIAL_RESULT = False
+
     async def confirm(self, path: str, operation: str) -> bool:
         """Always deny confirmation requests."""
         return False
@@ -48,6 +67,8 @@ class AutoAllowConfirmationStrategy(ConfirmationStrategy):
     only be used in controlled test environments.
     """
 
+    TRIVIAL_RESULT = True
+
     async def confirm(self, path: str, operation: str) -> bool:
         """Always allow confirmation requests."""
         return True
@@ -78,6 +78,9 @@ class QuestionTimeoutError(Exception):
 # 存储待回答的问题
 _pending_questions: dict[str, asyncio.Future] = {}
 
+# 按会话索引待回答的问题 ID，has_pending_questions 无需扫描全部问题
+_pending_by_session: dict[str, set[str]] = {}
+
 
 # ==================== 公开接口 ====================
 
@@ -110,6 +113,7 @@ async def ask_questions(
     future: asyncio.Future[list[Answer]] = loop.create_future()
     question_id = f"{session_id}_{id(future)}"
     _pending_questions[question_id] = future
+    _pending_by_session.setdefault(session_id, set()).add(question_id)
 
     try:
         # 发布问题事件（异步）
@@ -141,6 +145,11 @@ async def ask_questions(
         raise QuestionTimeoutError(f"Question timed out after {timeout}s")
     finally:
         _pending_questions.pop(question_id, None)
+        session_questions = _pending_by_session.get(session_id)
+        if session_questions is not None:
+            session_questions.discard(question_id)
+            if not session_questions:
+                del _pending_by_session[session_id]
 
 
 def submit_answers(question_id: str, answers: list[Answer]) -> bool:
@@ -191,7 +200,7 @@ def has_pending_questions(session_id: str) -> bool:
     """
     检查会话是否有待回答的问题。
     """
-    return any(qid.startswith(f"{session_id}_") for qid in _pending_questions)
+    return bool(_pending_by_session.get(session_id))
 
 
 def clear_pending_questions() -> None:
@@ -205,3 +214,4 @@ def clear_pending_questions() -> None:
         if not future.done():
             future.cancel()
     _pending_questions.clear()
+    _pending_by_session.clear()
@@ -52,6 +52,9 @@ def initialize_path_guard_middleware(
     global _wild_mode
     _wild_mode = wild_mode
 
+    # Release the previous session's audit log before replacing it
+    close_path_guard_middleware()
+
     from pathlib import Path
 
     guard_config = PathGuardConfig(
@@ -80,6 +83,15 @@ def initialize_path_guard_middleware(
     _middleware = PathGuardMiddleware(_path_checker, strategy)
 
 
+def close_path_guard_middleware() -> None:
+    """Release resources held by the global middleware (its audit log handle).
+
+    The middleware stays usable; the audit log is reopened on the next denial.
+    """
+    if _middleware is not None:
+        _middleware.close()
+
+
 def get_path_guard_middleware() -> PathGuardMiddleware:
     """Get the global PathGuard middleware."""
     if _middleware is None: